@@ -2,10 +2,14 @@ import os
 import sys
 import random
 import json
+import weakref
 import pygame
 
 pygame.init()
 pygame.joystick.init()
+# Nothing in the game reads these; keep them out of the queue entirely.
+# (MOUSEMOTION is still needed by the hitbox editor, VIDEOEXPOSE by the menu redraws.)
+pygame.event.set_blocked([pygame.TEXTINPUT, pygame.ACTIVEEVENT])
 
 # =====================
 # SPRITE FOOT-ANCHORING (optional per character)
@@ -39,6 +43,21 @@ def _opaque_bottom_y(img: pygame.Surface) -> int:
     return bottom
 
 
+# Horizontally mirrored frames, keyed weakly by the source frame. Fighters facing
+# left used to get a fresh transform.flip() copy every frame; animation frames are
+# long-lived, so each one is mirrored once and reused (which also keeps the id()
+# keyed _opaque_bottom_y cache hitting). Frames are reloaded every match, so an
+# entry goes away together with its source frame.
+_FLIPPED_CACHE: "weakref.WeakKeyDictionary[pygame.Surface, pygame.Surface]" = weakref.WeakKeyDictionary()
+
+def _flipped(img: pygame.Surface) -> pygame.Surface:
+    out = _FLIPPED_CACHE.get(img)
+    if out is None:
+        out = pygame.transform.flip(img, True, False)
+        _FLIPPED_CACHE[img] = out
+    return out
+
+
 def _opaque_anchor_x_bottom(img: pygame.Surface, *, min_alpha: int = 1, window_px: int = 40) -> int:
     """Return a stable-ish horizontal anchor near the feet (bottom of the sprite).
 
@@ -116,6 +135,7 @@ class SoundManager:
         self._menu_music_path = None
         self._fight_music_paths = []
         self._music_mode = None  # 'menu' or 'fight'
+        self._music_playing = False  # a track was started and hasn't been seen ending yet
         self._music_volume = 0.25  # atmospheric; SFX should dominate
         self.MUSIC_END_EVENT = pygame.USEREVENT + 42
         # Preloaded sounds
@@ -136,9 +156,10 @@ class SoundManager:
             self._hit_channel = pygame.mixer.Channel(2)
             self._damage_channel = pygame.mixer.Channel(3)
             self.enabled = True
-            # Music end event (for fight playlist)
+            # Track ends are detected by poll_music() once per frame, so the end
+            # event is kept out of the event queue entirely.
             try:
-                pygame.mixer.music.set_endevent(self.MUSIC_END_EVENT)
+                pygame.event.set_blocked(self.MUSIC_END_EVENT)
                 pygame.mixer.music.set_volume(self._music_volume)
             except Exception:
                 pass
@@ -249,6 +270,7 @@ class SoundManager:
         except Exception:
             pass
         self._music_mode = None
+        self._music_playing = False
 
     def _play_music_file(self, path: str, loop: int = 0):
         if not self.enabled or not path:
@@ -261,6 +283,7 @@ class SoundManager:
             pygame.mixer.music.load(path)
             pygame.mixer.music.set_volume(self._music_volume)
             pygame.mixer.music.play(loop)
+            self._music_playing = True
         except Exception:
             pass
 
@@ -282,8 +305,20 @@ class SoundManager:
         self._music_mode = 'fight'
         self._play_music_file(random.choice(self._fight_music_paths), loop=0)
 
+    def poll_music(self):
+        """Call once per frame: advances the playlist when the current track has ended."""
+        if not self._music_playing:
+            return
+        try:
+            if pygame.mixer.music.get_busy():
+                return
+        except Exception:
+            return
+        self._music_playing = False
+        self.handle_music_end_event()
+
     def handle_music_end_event(self):
-        """Call when MUSIC_END_EVENT is received."""
+        """Called by poll_music() when the current track has ended."""
         if not self.enabled:
             return
         if self._music_mode == 'fight' and self._fight_music_paths:
@@ -429,12 +464,24 @@ def hb_get_world_boxes(fighter):
     return push_r, hurt_rs, hit_rs
 
 
+def hb_get_world_pushbox(fighter):
+    # Like hb_get_world_boxes but only converts the pushbox (hurt/hit lists are skipped).
+    push, _hurt, _hit = hb_get_local_boxes(fighter)
+    if push is None:
+        return None
+    try:
+        img = fighter.current_frame_info()[0]
+    except Exception:
+        img = None
+    return hb_local_to_world(fighter, push, y_offset=_render_y_offset(fighter, img))
+
+
 def hb_resolve_pushboxes(p1, p2):
     """Separate fighters horizontally using saved pushboxes (MK-style).
     If no pushbox is saved for a fighter/frame, falls back to fighter.rect.
     """
-    r1, _, _ = hb_get_world_boxes(p1)
-    r2, _, _ = hb_get_world_boxes(p2)
+    r1 = hb_get_world_pushbox(p1)
+    r2 = hb_get_world_pushbox(p2)
     if r1 is None:
         r1 = p1.rect
     if r2 is None:
@@ -461,6 +508,10 @@ def hb_resolve_pushboxes(p1, p2):
 # =====================
 WIDTH, HEIGHT = 1000, 600
 FPS = 60
+# Frame cap for the title / character / stage select menus (fights always use FPS).
+# Menus are static and nav repeats are debounced at 120-180ms, so 30 is still
+# responsive and halves menu CPU; 60 keeps one frame less of input latency.
+MENU_FPS = 60
 
 
 # =====================
@@ -883,6 +934,13 @@ HUD_TIMER_Y = 28
 HUD_ROMAN_Y = 68
 HUD_ROUND_Y = 80
 
+# Health bar geometry (bars hug the screen edges) and the score text centered over each bar.
+BAR_W = 280
+MARGIN = 50
+SCORE_YELLOW = (255, 255, 0)
+P1_SCORE_CX = MARGIN + BAR_W // 2
+P2_SCORE_CX = WIDTH - MARGIN - BAR_W // 2
+
 # =====================
 # MENUS
 # =====================
@@ -903,8 +961,49 @@ CHAR_INDEX_TO_ID = {
 
 STAGESELECT_BG_PATH = '/Users/blake/Documents/Mac_Code/MKUltra/menu/StageSelect.jpeg'
 
+# Stage select preview slots (2x2), computed once for the fixed screen size.
+# Template is 600x600 with borders near x=116,295,484 and y=115,301,484
+def _build_stage_select_rects() -> tuple[pygame.Rect, ...]:
+    tW, tH = 600, 600
+    pad = 6
+    xL, xM, xR = 116, 295, 484
+    yT, yM, yB = 115, 301, 484
+    rects_t = [
+        pygame.Rect(xL+pad, yT+pad, (xM-xL)-2*pad, (yM-yT)-2*pad),
+        pygame.Rect(xM+pad, yT+pad, (xR-xM)-2*pad, (yM-yT)-2*pad),
+        pygame.Rect(xL+pad, yM+pad, (xM-xL)-2*pad, (yB-yM)-2*pad),
+        pygame.Rect(xM+pad, yM+pad, (xR-xM)-2*pad, (yB-yM)-2*pad),
+    ]
+    sx = WIDTH / tW
+    sy = HEIGHT / tH
+    return tuple(pygame.Rect(int(r.x*sx), int(r.y*sy), int(r.w*sx), int(r.h*sy)) for r in rects_t)
+
+STAGE_SELECT_RECTS = _build_stage_select_rects()
+
+# Stage select neighbour tables, per number of occupied slots (1-4):
+# (left, right, up, down)[direction][sel] -> new sel, wrapping like (sel +/- n) % slots.
+STAGE_SELECT_NAV: dict[int, tuple[tuple[int, ...], ...]] = {
+    n: tuple(tuple((i + step) % n for i in range(n)) for step in (-1, 1, -2, 2))
+    for n in range(1, 5)
+}
+
 MENU_ITEM_GAP = 18
 
+# CPU difficulty bar shown on the NPC select screen. Difficulty moves in 0.05 steps,
+# so every possible bar string is precomputed (index = filled segments).
+CPU_BAR_LEN = 10
+CPU_BAR_STRINGS = tuple('[' + '=' * f + '-' * (CPU_BAR_LEN - f) + ']' for f in range(CPU_BAR_LEN + 1))
+
+# Menu input sets, built once instead of as tuple literals inside the event loops.
+_JOY_EVENT_TYPES = frozenset((pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION, pygame.JOYAXISMOTION))
+_JOY_DEVICE_EVENTS = frozenset((pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED))
+_NAV_BACK_KEYS = frozenset((pygame.K_ESCAPE, pygame.K_BACKSPACE))
+_NAV_CONFIRM_KEYS = frozenset((pygame.K_RETURN, pygame.K_KP_ENTER))
+_NAV_LEFT_KEYS = frozenset((pygame.K_LEFT, pygame.K_a))
+_NAV_RIGHT_KEYS = frozenset((pygame.K_RIGHT, pygame.K_d))
+_NAV_UP_KEYS = frozenset((pygame.K_UP, pygame.K_w))
+_NAV_DOWN_KEYS = frozenset((pygame.K_DOWN, pygame.K_s))
+
 # Character select boxes mapped in SOURCE space of CharacterSelect.jpg (585x328)
 # (x, y, w, h) for 2 rows x 5 cols.
 CHARSELECT_BOXES_SRC: list[tuple[int, int, int, int]] = [
@@ -1553,8 +1652,37 @@ def load_game_font(size: int) -> pygame.font.Font:
     return pygame.font.SysFont(None, size)
 
 
+# Rendered text surfaces keyed by (font, text, color). HUD strings (scores, timer,
+# round label, tallies, pause/round-over text) repeat frame after frame, so each
+# distinct string is rasterized once. Entries carry the half width callers centre
+# with. Cleared wholesale if it ever grows large.
+_TEXT_CACHE: dict[tuple[pygame.font.Font, str, tuple[int, int, int]], tuple[pygame.Surface, int]] = {}
+_TEXT_CACHE_MAX = 256
+
+
+def render_cached(font: pygame.font.Font, text: str,
+                  color: tuple[int, int, int]) -> tuple[pygame.Surface, int]:
+    """font.render(text, True, color) plus its half width, reusing both for repeated strings.
+
+    The returned surface is shared; callers must not draw onto it.
+    """
+    key = (font, text, color)
+    entry = _TEXT_CACHE.get(key)
+    if entry is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.clear()
+        surf = font.render(text, True, color)
+        entry = (surf, surf.get_width() // 2)
+        _TEXT_CACHE[key] = entry
+    return entry
+
+
 def try_load_image(path: str, *, convert_alpha: bool = True) -> pygame.Surface | None:
-    """Load an image if present; return None if missing/unloadable."""
+    """Load an image if present; return None if missing/unloadable.
+
+    The result is already converted to the display format (convert/convert_alpha),
+    so callers can blit it directly without a per-blit pixel format conversion.
+    """
     if not path:
         return None
     try:
@@ -2295,6 +2423,16 @@ class Fighter:
         self.rect = pygame.Rect(x, get_ground_y() - PLAYER_H, PLAYER_W, PLAYER_H)
         self.color = color
         self.controls = controls
+        # Key codes resolved once; update() indexes the pressed-keys array with these.
+        self.k_left = controls['left']
+        self.k_right = controls['right']
+        self.k_jump = controls['jump']
+        self.k_crouch = controls['crouch']
+        self.k_block = controls['block']
+        self.k_attack_r = controls['attack_r']
+        self.k_attack_e = controls['attack_e']
+        self.k_attack_t = controls['attack_t']
+        self.k_attack_y = controls['attack_y']
         self.health = 100
 
         # Scoring: +200 points for each 10% (10 health) knocked off the opponent.
@@ -2533,8 +2671,8 @@ class Fighter:
         - Direction is committed at takeoff (no air steering).
         - Jump is not allowed while blocking / attacking / stunned.
         """
-        left_pressed = keys[self.controls["left"]]
-        right_pressed = keys[self.controls["right"]]
+        left_pressed = keys[self.k_left]
+        right_pressed = keys[self.k_right]
 
         if left_pressed and not right_pressed:
             self.jump_dx = -JUMP_HSPEED
@@ -2594,7 +2732,7 @@ class Fighter:
                     self.medium_idle.update()
             return
 
-        jump_held = keys[self.controls["jump"]]
+        jump_held = keys[self.k_jump]
         jump_pressed = jump_held and (not self._prev_jump)
         self._prev_jump = jump_held
 
@@ -2674,7 +2812,7 @@ class Fighter:
             self.stance = 'high'
             return
 
-        if keys[self.controls['crouch']]:
+        if keys[self.k_crouch]:
             self.stance = 'low'
         else:
             self.stance = 'medium'
@@ -2764,7 +2902,7 @@ class Fighter:
         (self._set_low_state if self.stance == "low" else self._set_medium_state)("idle")
 
     def update_block(self, keys: pygame.key.ScancodeWrapper):
-        block_held = keys[self.controls["block"]]
+        block_held = keys[self.k_block]
 
         if self.in_air or self.stance not in ('medium','low'):
             if self.is_blocking:
@@ -2908,10 +3046,10 @@ class Fighter:
         # Air attacks (one per jump, MK-style)
         if self.in_air:
             # Any attack button triggers the single high flop attack animation (once per jump).
-            r_held = keys[self.controls['attack_r']]
-            e_held = keys[self.controls['attack_e']]
-            t_held = keys[self.controls['attack_t']]
-            y_held = keys[self.controls['attack_y']]
+            r_held = keys[self.k_attack_r]
+            e_held = keys[self.k_attack_e]
+            t_held = keys[self.k_attack_t]
+            y_held = keys[self.k_attack_y]
 
             r_pressed = r_held and not self._prev_r
             e_pressed = e_held and not self._prev_e
@@ -2933,16 +3071,16 @@ class Fighter:
         if self.stance not in ("medium", "low"):
             if self.is_attacking:
                 self._end_attack()
-            self._prev_r = keys[self.controls["attack_r"]]
-            self._prev_e = keys[self.controls["attack_e"]]
-            self._prev_t = keys[self.controls["attack_t"]]
-            self._prev_y = keys[self.controls["attack_y"]]
+            self._prev_r = keys[self.k_attack_r]
+            self._prev_e = keys[self.k_attack_e]
+            self._prev_t = keys[self.k_attack_t]
+            self._prev_y = keys[self.k_attack_y]
             return
 
-        r_held = keys[self.controls["attack_r"]]
-        e_held = keys[self.controls["attack_e"]]
-        t_held = keys[self.controls["attack_t"]]
-        y_held = keys[self.controls["attack_y"]]
+        r_held = keys[self.k_attack_r]
+        e_held = keys[self.k_attack_e]
+        t_held = keys[self.k_attack_t]
+        y_held = keys[self.k_attack_y]
 
         r_pressed = r_held and not self._prev_r
         e_pressed = e_held and not self._prev_e
@@ -3128,8 +3266,8 @@ class Fighter:
         # No new actions while stunned (MK-style turn-taking)
         if self._stunned() or self.is_knocked_down():
             return
-        left = keys[self.controls["left"]]
-        right = keys[self.controls["right"]]
+        left = keys[self.k_left]
+        right = keys[self.k_right]
 
         # no movement during hit, block, or attack
         if self.is_hit or self.is_blocking or self.is_attacking:
@@ -3220,7 +3358,7 @@ class Fighter:
 
 
             # Start air attack on R (one per jump), direction locked at takeoff (MK 90s)
-            r_held = keys[self.controls["attack_r"]]
+            r_held = keys[self.k_attack_r]
             r_pressed = r_held and (not self._prev_r)
             if self.in_air and (not self.air_attack_used) and r_pressed and (self.air_state == 'move'):
                 self.air_state = 'attack'
@@ -3316,7 +3454,7 @@ class Fighter:
                 return
 
             if self.flip:
-                img = pygame.transform.flip(img, True, False)
+                img = _flipped(img)
 
             if getattr(self, "anchor_feet", False):
                 bottom = _opaque_bottom_y(img)
@@ -3536,6 +3674,16 @@ class Scorpion:
         self.rect = pygame.Rect(x, get_ground_y() - PLAYER_H, PLAYER_W, PLAYER_H)
         self.color = color
         self.controls = controls
+        # Key codes resolved once; update() indexes the pressed-keys array with these.
+        self.k_left = controls['left']
+        self.k_right = controls['right']
+        self.k_jump = controls['jump']
+        self.k_crouch = controls['crouch']
+        self.k_block = controls['block']
+        self.k_attack_r = controls['attack_r']
+        self.k_attack_e = controls['attack_e']
+        self.k_attack_t = controls['attack_t']
+        self.k_attack_y = controls['attack_y']
         self.health = 100
 
         # Scoring: +200 points for each 10% (10 health) knocked off the opponent.
@@ -3793,8 +3941,8 @@ class Scorpion:
         - Direction is committed at takeoff (no air steering).
         - Jump is not allowed while blocking / attacking / stunned.
         """
-        left_pressed = keys[self.controls["left"]]
-        right_pressed = keys[self.controls["right"]]
+        left_pressed = keys[self.k_left]
+        right_pressed = keys[self.k_right]
 
         if left_pressed and not right_pressed:
             self.jump_dx = -JUMP_HSPEED
@@ -3854,7 +4002,7 @@ class Scorpion:
                     self.medium_idle.update()
             return
 
-        jump_held = keys[self.controls["jump"]]
+        jump_held = keys[self.k_jump]
         jump_pressed = jump_held and (not self._prev_jump)
         self._prev_jump = jump_held
 
@@ -3934,7 +4082,7 @@ class Scorpion:
             self.stance = 'high'
             return
 
-        if keys[self.controls['crouch']]:
+        if keys[self.k_crouch]:
             self.stance = 'low'
         else:
             self.stance = 'medium'
@@ -4025,7 +4173,7 @@ class Scorpion:
         (self._set_low_state if self.stance == "low" else self._set_medium_state)("idle")
 
     def update_block(self, keys: pygame.key.ScancodeWrapper):
-        block_held = keys[self.controls["block"]]
+        block_held = keys[self.k_block]
 
         if self.in_air or self.stance not in ('medium','low'):
             if self.is_blocking:
@@ -4169,10 +4317,10 @@ class Scorpion:
         # Air attacks (one per jump, MK-style)
         if self.in_air:
             # Any attack button triggers the single high flop attack animation (once per jump).
-            r_held = keys[self.controls['attack_r']]
-            e_held = keys[self.controls['attack_e']]
-            t_held = keys[self.controls['attack_t']]
-            y_held = keys[self.controls['attack_y']]
+            r_held = keys[self.k_attack_r]
+            e_held = keys[self.k_attack_e]
+            t_held = keys[self.k_attack_t]
+            y_held = keys[self.k_attack_y]
 
             r_pressed = r_held and not self._prev_r
             e_pressed = e_held and not self._prev_e
@@ -4194,16 +4342,16 @@ class Scorpion:
         if self.stance not in ("medium", "low"):
             if self.is_attacking:
                 self._end_attack()
-            self._prev_r = keys[self.controls["attack_r"]]
-            self._prev_e = keys[self.controls["attack_e"]]
-            self._prev_t = keys[self.controls["attack_t"]]
-            self._prev_y = keys[self.controls["attack_y"]]
+            self._prev_r = keys[self.k_attack_r]
+            self._prev_e = keys[self.k_attack_e]
+            self._prev_t = keys[self.k_attack_t]
+            self._prev_y = keys[self.k_attack_y]
             return
 
-        r_held = keys[self.controls["attack_r"]]
-        e_held = keys[self.controls["attack_e"]]
-        t_held = keys[self.controls["attack_t"]]
-        y_held = keys[self.controls["attack_y"]]
+        r_held = keys[self.k_attack_r]
+        e_held = keys[self.k_attack_e]
+        t_held = keys[self.k_attack_t]
+        y_held = keys[self.k_attack_y]
 
         r_pressed = r_held and not self._prev_r
         e_pressed = e_held and not self._prev_e
@@ -4438,8 +4586,8 @@ class Scorpion:
         # No new actions while stunned (MK-style turn-taking)
         if self._stunned() or self.is_knocked_down():
             return
-        left = keys[self.controls["left"]]
-        right = keys[self.controls["right"]]
+        left = keys[self.k_left]
+        right = keys[self.k_right]
 
         # no movement during hit, block, or attack
         if self.is_hit or self.is_blocking or self.is_attacking:
@@ -4535,7 +4683,7 @@ class Scorpion:
 
 
             # Start air attack on R (one per jump), direction locked at takeoff (MK 90s)
-            r_held = keys[self.controls["attack_r"]]
+            r_held = keys[self.k_attack_r]
             r_pressed = r_held and (not self._prev_r)
             if self.in_air and (not self.air_attack_used) and r_pressed and (self.air_state == 'move'):
                 self.air_state = 'attack'
@@ -4638,7 +4786,7 @@ class Scorpion:
                 return
 
             if self.flip:
-                img = pygame.transform.flip(img, True, False)
+                img = _flipped(img)
 
             if getattr(self, "anchor_feet", False):
                 bottom = _opaque_bottom_y(img)
@@ -4724,6 +4872,17 @@ class _VirtualKeys:
         return self.state.get(key, False)
 
 
+class _NoKeys:
+    # A keys wrapper that reports no input (used to freeze fighters between rounds)
+    __slots__ = ()
+
+    def __getitem__(self, _key):
+        return False
+
+
+NO_KEYS = _NoKeys()
+
+
 def _get_connected_joysticks() -> list[pygame.joystick.Joystick]:
     """Return initialized joystick objects for all currently connected devices."""
     sticks: list[pygame.joystick.Joystick] = []
@@ -4742,6 +4901,39 @@ def _get_connected_joysticks() -> list[pygame.joystick.Joystick]:
     return sticks
 
 
+# Connected pads shared by the menus and the match setup. The device list only
+# changes when SDL reports a pad being added/removed, so every event loop feeds
+# those events to mark_joysticks_stale() and get_joysticks() rescans lazily.
+_JOYSTICKS: list[pygame.joystick.Joystick] = []
+_joysticks_dirty = True
+
+
+def mark_joysticks_stale() -> None:
+    """Force the next get_joysticks() call to rescan (JOYDEVICEADDED / JOYDEVICEREMOVED)."""
+    global _joysticks_dirty
+    _joysticks_dirty = True
+
+
+def get_joysticks() -> list[pygame.joystick.Joystick]:
+    """Return the cached list of connected joysticks, rescanning only when stale."""
+    global _JOYSTICKS, _joysticks_dirty
+    if _joysticks_dirty:
+        _JOYSTICKS = _get_connected_joysticks()
+        _joysticks_dirty = False
+    return _JOYSTICKS
+
+
+def _js_instance_id(js: pygame.joystick.Joystick) -> int:
+    # pygame 2 uses instance ids; fall back safely.
+    try:
+        return js.get_instance_id()
+    except Exception:
+        try:
+            return js.get_id()
+        except Exception:
+            return -1
+
+
 class ControllerProvider:
     """Maps a game controller to the fighter's existing keyboard controls.
 
@@ -5145,15 +5337,13 @@ class IntroPlayer:
         if img is None:
             return
         if self.flip:
-            img = pygame.transform.flip(img, True, False)
+            img = _flipped(img)
         surf.blit(img, (self.rect.x, self.rect.y + self.y_nudge))
 
 
 def draw_health_bar(x: int, y: int, health: int, color: tuple[int, int, int]) -> None:
-    BAR_W = 280
     BAR_H = 22
     BORDER = 3
-    MARGIN = 50
 
     # Clamp health visually (no logic change)
     health = max(0, min(100, health))
@@ -5182,14 +5372,79 @@ def draw_health_bar(x: int, y: int, health: int, color: tuple[int, int, int]) ->
     )
 
 
+# Last HUD text state and the blit list built for it (see build_hud_blits).
+_hud_last_state: tuple | None = None
+_hud_last_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+
+
+def build_hud_blits(font_small: pygame.font.Font, font_mid: pygame.font.Font, p1, p2, remaining: int,
+                    current_round: int, p1_round_wins: int, p2_round_wins: int, *,
+                    text_color: tuple[int, int, int] = TEXT_RED,
+                    timer_y: int = HUD_TIMER_Y) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+    """Return the HUD text as a ``screen.blits`` list: scores, timer, round label and roman tallies.
+
+    The list is reused unchanged while none of its inputs change (most frames).
+    """
+    global _hud_last_state, _hud_last_blits
+    state = (font_small, font_mid, p1.score, p2.score, remaining, current_round,
+             p1_round_wins, p2_round_wins, text_color, timer_y)
+    if state == _hud_last_state:
+        return _hud_last_blits
+
+    # Score (yellow, numbers only) centered above each health bar
+    p1_score_surf, p1_score_surf_hw = render_cached(font_small, str(p1.score).zfill(4), SCORE_YELLOW)
+    p2_score_surf, p2_score_surf_hw = render_cached(font_small, str(p2.score).zfill(4), SCORE_YELLOW)
+
+    # Timer (top-center) and round label (centered under the timer)
+    timer_surf, timer_surf_hw = render_cached(font_mid, str(remaining).zfill(2), text_color)
+    round_surf, round_surf_hw = render_cached(font_small, f'ROUND {current_round}', text_color)
+
+    hud_blits = [
+        (p1_score_surf, (P1_SCORE_CX - p1_score_surf_hw, HUD_SCORE_Y)),
+        (p2_score_surf, (P2_SCORE_CX - p2_score_surf_hw, HUD_SCORE_Y)),
+        (timer_surf, (WIDTH // 2 - timer_surf_hw, timer_y)),
+        (round_surf, (WIDTH // 2 - round_surf_hw, HUD_ROUND_Y)),
+    ]
+
+    # MK-style round win indicators (roman numerals) under each health bar
+    # (centered where the original 200px bars at x=50 / x=WIDTH-250 had their middle).
+    left_roman = wins_to_roman(p1_round_wins)
+    right_roman = wins_to_roman(p2_round_wins)
+    if left_roman:
+        l_surf, l_surf_hw = render_cached(font_small, left_roman, text_color)
+        hud_blits.append((l_surf, (50 + 100 - l_surf_hw, HUD_ROMAN_Y)))
+    if right_roman:
+        r_surf, r_surf_hw = render_cached(font_small, right_roman, text_color)
+        hud_blits.append((r_surf, (WIDTH - 250 + 100 - r_surf_hw, HUD_ROMAN_Y)))
+
+    _hud_last_state = state
+    _hud_last_blits = hud_blits
+    return hud_blits
+
+
+def draw_hud(font_small: pygame.font.Font, font_mid: pygame.font.Font, p1, p2, remaining: int,
+             current_round: int, p1_round_wins: int, p2_round_wins: int, *,
+             text_color: tuple[int, int, int] = TEXT_RED, timer_y: int = HUD_TIMER_Y) -> None:
+    """Draw the match HUD: health bars plus the text from build_hud_blits.
+
+    Used by both the intro (white text, timer nudged up) and the fight.
+    """
+    draw_health_bar(MARGIN, HUD_HEALTH_Y, p1.health, BLUE)
+    draw_health_bar(WIDTH - MARGIN - BAR_W, HUD_HEALTH_Y, p2.health, RED)
+    screen.blits(build_hud_blits(font_small, font_mid, p1, p2, remaining, current_round,
+                                 p1_round_wins, p2_round_wins,
+                                 text_color=text_color, timer_y=timer_y), doreturn=0)
+
+
+_ROMANS = ('', 'I', 'II', 'III')
+
+
 def wins_to_roman(wins: int) -> str:
     """Convert round-win counts to MK-style roman numerals."""
-    if wins <= 0:
+    if 0 <= wins < len(_ROMANS):
+        return _ROMANS[wins]
+    if wins < 0:
         return ''
-    if wins == 1:
-        return 'I'
-    if wins == 2:
-        return 'II'
     # Shouldn't happen (best-of-3), but keep it safe.
     return 'I' * wins
 
@@ -5224,6 +5479,72 @@ def load_stage_background(stage_name: str, target_size: tuple[int, int]) -> pyga
     return None
 
 
+# Stage-select preview tiles keyed by (image path, tile size). Each image is decoded
+# and scaled the first time its tile is drawn, then reused on later menu visits.
+_STAGE_PREVIEW_CACHE: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+
+
+def get_stage_preview(path: str | None, size: tuple[int, int]) -> pygame.Surface:
+    """Return the stage image at path scaled to size (flat grey tile if missing)."""
+    key = (path or '', tuple(size))
+    surf = _STAGE_PREVIEW_CACHE.get(key)
+    if surf is None:
+        src = try_load_image(path, convert_alpha=False) if path else None
+        if src is None:
+            # fallback to a flat surface if missing
+            src = pygame.Surface((600, 600)).convert()
+            src.fill((60, 60, 60))
+        surf = pygame.transform.smoothscale(src, key[1]).convert()
+        _STAGE_PREVIEW_CACHE[key] = surf
+    return surf
+
+
+# Stage-select listing per stages folder: (folder mtime, stage_keys, stage_paths).
+# Adding, removing or renaming a file bumps the folder mtime, which triggers a rebuild.
+_STAGE_LIST_CACHE: dict[str, tuple[float | None, list[str], dict[str, str]]] = {}
+
+
+def get_stage_select_entries(stage_dir: str) -> tuple[list[str], dict[str, str]]:
+    """Return (stage_keys, stage_paths) for the stage select menu.
+
+    Known STAGES come first, followed by any other images found in stage_dir
+    (which are auto-registered into STAGES).
+    """
+    try:
+        mtime = os.stat(stage_dir).st_mtime
+    except OSError:
+        mtime = None
+    cached = _STAGE_LIST_CACHE.get(stage_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    discovered = discover_stage_images(stage_dir)
+    stage_keys = []
+    stage_paths = {}
+
+    # Include known stages first. Probe the filesystem (not the listing) so name
+    # matching follows the filesystem's case rules, e.g. thepit.png on macOS.
+    for k, cfg in STAGES.items():
+        stage_keys.append(k)
+        bgname = cfg.get('bg', k)
+        for ext in ('.png', '.jpg', '.jpeg', '.gif'):
+            p = os.path.join(stage_dir, bgname + ext)
+            if os.path.exists(p):
+                stage_paths[k] = p
+                break
+
+    # Add discovered images (auto-register)
+    for k, p in discovered:
+        if k not in stage_keys:
+            stage_keys.append(k)
+            stage_paths[k] = p
+        if k not in STAGES:
+            STAGES[k] = {'bg': k, 'ground_y': DEFAULT_GROUND_Y}
+
+    _STAGE_LIST_CACHE[stage_dir] = (mtime, stage_keys, stage_paths)
+    return stage_keys, stage_paths
+
+
 def draw_stage(surf: pygame.Surface, bg: pygame.Surface | None = None) -> None:
     """Draw the stage background (full photo).
 
@@ -5249,6 +5570,212 @@ def blit_scaled_fill(dst: pygame.Surface, img: pygame.Surface) -> tuple[float, f
     dst.blit(scaled, (0, 0))
     return (sx, sy)
 
+def run_stage_select(screen: pygame.Surface, clock: pygame.time.Clock, font_mid: pygame.font.Font, poll_dpad) -> str | None:
+    """Return selected stage key or None to go back.
+
+    `poll_dpad(js)` is the caller's d-pad reader (see main()); everything the
+    loop touches per frame is a plain local here rather than a closure cell.
+    """
+    stage_dir = '/Users/blake/Documents/Mac_Code/MKUltra/stages'
+    stage_keys, stage_paths = get_stage_select_entries(stage_dir)
+
+    if not stage_keys:
+        return DEFAULT_STAGE_NAME
+
+    # Loop invariants / hot lookups bound once for the menu's lifetime.
+    nav_mod = min(4, len(stage_keys))
+    get_ticks = pygame.time.get_ticks
+    ev_get = pygame.event.get
+    get_sticks = get_joysticks
+
+    bg_img = try_load_image(STAGESELECT_BG_PATH, convert_alpha=False) or try_load_image(
+        os.path.join(os.path.dirname(__file__), 'StageSelect.jpeg'), convert_alpha=False
+    )
+    bg_img = pygame.transform.scale(bg_img, (WIDTH, HEIGHT)).convert()
+
+    nav_left, nav_right, nav_up, nav_down = STAGE_SELECT_NAV[nav_mod]
+    # Only the first nav_mod slots have a stage behind them.
+    active_rects = STAGE_SELECT_RECTS[:nav_mod]
+
+    sel = 0
+    # Controller navigation (single-screen UI)
+    next_nav_ms = 0
+    ignore_confirm_until = get_ticks() + 250
+    # Only the event types handled below are copied out of SDL; the rest is cleared per frame.
+    handled_types = [
+        pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+        pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION, pygame.JOYAXISMOTION,
+        pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+        pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+    ]
+    stick_dead = 0.45
+    # Dirty-rect redraw state
+    full_redraw = True
+    drawn_sel = None
+    label_rect = None
+    last_label = None
+    label_surf = None
+    while True:
+        clock.tick(MENU_FPS)
+        # Active controller is resolved once per frame (cached list; rescanned on hotplug).
+        sticks = get_sticks()
+        js = sticks[0] if sticks else None
+        jid = _js_instance_id(js) if js is not None else None
+        latest_hat = None
+        latest_axis = {0: None, 1: None}
+        SOUND_MGR.poll_music()
+        for event in ev_get(handled_types):
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit(0)
+            if event.type in _JOY_DEVICE_EVENTS:
+                mark_joysticks_stale()
+                sticks = get_sticks()
+                js = sticks[0] if sticks else None
+                jid = _js_instance_id(js) if js is not None else None
+                continue
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                full_redraw = True
+                continue
+            if event.type == pygame.KEYDOWN:
+                if event.key in _NAV_BACK_KEYS:
+                    return None
+                if event.key == pygame.K_RETURN:
+                    return stage_keys[sel]
+                if event.key in _NAV_LEFT_KEYS:
+                    sel = nav_left[sel]
+                if event.key in _NAV_RIGHT_KEYS:
+                    sel = nav_right[sel]
+                if event.key in _NAV_UP_KEYS:
+                    sel = nav_up[sel]
+                if event.key in _NAV_DOWN_KEYS:
+                    sel = nav_down[sel]
+            # Controller support (D-pad / left stick / A confirm / B back)
+            # Other axes and at-rest stick jitter inside the deadzone never navigate.
+            if event.type == pygame.JOYAXISMOTION and (
+                event.axis not in (0, 1) or -stick_dead <= event.value <= stick_dead
+            ):
+                continue
+            if event.type in _JOY_EVENT_TYPES:
+                if js is not None:
+                    e_jid = getattr(event, 'instance_id', getattr(event, 'joy', -999))
+                    if e_jid == jid:
+                        now_ms = get_ticks()
+
+                        # Hat / stick motion: keep only the last value seen this frame.
+                        if event.type == pygame.JOYHATMOTION:
+                            latest_hat = event.value
+                        elif event.type == pygame.JOYAXISMOTION:
+                            latest_axis[event.axis] = float(event.value)
+
+                        # Buttons: B back, A confirm. JOYBUTTONDOWN is already the press edge.
+                        if event.type == pygame.JOYBUTTONDOWN:
+                            if now_ms < ignore_confirm_until:
+                                continue
+
+                            if event.button == 1:
+                                return None
+                            if event.button == 0:
+                                return stage_keys[sel]
+
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                mx, my = event.pos
+                for i, r in enumerate(active_rects):
+                    if r.collidepoint(mx, my):
+                        sel = i
+                        return stage_keys[sel]
+        pygame.event.clear(pump=False)
+
+        now_ms = get_ticks()
+
+        # D-pad navigation (hat), from the last hat event of the frame
+        if latest_hat is not None and now_ms >= next_nav_ms:
+            hx, hy = latest_hat
+            if hx < 0:
+                sel = nav_left[sel]
+                next_nav_ms = now_ms + 140
+            elif hx > 0:
+                sel = nav_right[sel]
+                next_nav_ms = now_ms + 140
+            elif hy > 0:
+                sel = nav_up[sel]
+                next_nav_ms = now_ms + 160
+            elif hy < 0:
+                sel = nav_down[sel]
+                next_nav_ms = now_ms + 160
+
+        # Left stick navigation (axes 0/1), from the last sample of each axis
+        if now_ms >= next_nav_ms:
+            vx = latest_axis[0]
+            vy = latest_axis[1]
+            if vx is not None and vx < -stick_dead:
+                sel = nav_left[sel]
+                next_nav_ms = now_ms + 140
+            elif vx is not None and vx > stick_dead:
+                sel = nav_right[sel]
+                next_nav_ms = now_ms + 140
+            elif vy is not None and vy < -stick_dead:
+                sel = nav_up[sel]
+                next_nav_ms = now_ms + 160
+            elif vy is not None and vy > stick_dead:
+                sel = nav_down[sel]
+                next_nav_ms = now_ms + 160
+
+        # Controller polling fallback (some mappings don't emit hat events reliably).
+        # Runs once per frame; next_nav_ms keeps the repeat rate in check.
+        if js is not None:
+            hx, hy = poll_dpad(js)
+            if now_ms >= next_nav_ms:
+                if hx < 0:
+                    sel = nav_left[sel]
+                    next_nav_ms = now_ms + 140
+                elif hx > 0:
+                    sel = nav_right[sel]
+                    next_nav_ms = now_ms + 140
+                elif hy > 0:
+                    sel = nav_up[sel]
+                    next_nav_ms = now_ms + 160
+                elif hy < 0:
+                    sel = nav_down[sel]
+                    next_nav_ms = now_ms + 160
+
+        # Full redraw on the first frame (or after an expose); afterwards only the
+        # old/new selected tiles and the label area change, so push just those rects.
+        if full_redraw or sel != drawn_sel:
+            if full_redraw:
+                screen.blit(bg_img, (0, 0))
+                slots = range(len(active_rects))
+            else:
+                slots = (drawn_sel, sel)
+            dirty_rects = []
+            for i in slots:
+                r = active_rects[i]
+                k = stage_keys[i]
+                pv = get_stage_preview(stage_paths.get(k), r.size)
+                screen.blit(pv, r.topleft)
+                if i == sel:
+                    pygame.draw.rect(screen, (255, 215, 0), r, 4)
+                dirty_rects.append(r)
+
+            if label_rect is not None and not full_redraw:
+                # Restore the background under the previous label.
+                screen.blit(bg_img, label_rect, label_rect)
+                dirty_rects.append(label_rect)
+            label = stage_keys[sel]
+            if label != last_label:
+                label_surf = font_mid.render(label, True, (255, 255, 255))
+                last_label = label
+            label_rect = screen.blit(label_surf, (WIDTH//2 - label_surf.get_width()//2, int(HEIGHT*0.85)))
+            dirty_rects.append(label_rect)
+
+            if full_redraw:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+            full_redraw = False
+            drawn_sel = sel
+
+
 def _assert_engine_contract():
     """Fail fast with a clear message if core class contracts are broken."""
     required = [
@@ -5307,150 +5834,190 @@ def main() -> None:
 
     npc_difficulty = 0.5
 
+    # --- Menu assets (static; loaded once, reused on every return to title) ---
+    font_title = load_game_font(92)
+    font_menu = load_game_font(52)
+    font_hint = load_game_font(28)
+    # Slightly smaller hint font for multi-line bottom prompts (prevents overflowing off screen).
+    font_hint_small = load_game_font(22)
+
+    title_bg = try_load_image(TITLESCREEN_BG_PATH, convert_alpha=False)
+    # Fallback to the uploaded screenshot if the absolute path isn't available on this machine.
+    char_bg = try_load_image(CHARSELECT_BG_PATH, convert_alpha=False) or try_load_image(
+        os.path.join(os.path.dirname(__file__), '46tooe.jpg'), convert_alpha=False
+    )
+    nate_thumb = try_load_image(NATE_SELECT_PATH, convert_alpha=True)
+    scorpion_thumb = try_load_image(SCORPION_SELECT_PATH, convert_alpha=True)
+    connor_thumb = try_load_image(CONNOR_SELECT_PATH, convert_alpha=True)
+    blake_thumb = try_load_image(BLAKE_SELECT_PATH, convert_alpha=True)
+    # Portrait per character-select box (index = box index).
+    portrait_data = [
+        ('nate', nate_thumb),
+        ('scorpion', scorpion_thumb),
+        ('connor', connor_thumb),
+        ('blake', blake_thumb),
+    ]
+
     # -----------------
     while True:
         goto_title = False
         SOUND_MGR.play_menu_music()
         # TITLE MENU
         # -----------------
-        font_title = load_game_font(92)
-        font_menu = load_game_font(52)
-        font_hint = load_game_font(28)
-        # Slightly smaller hint font for multi-line bottom prompts (prevents overflowing off screen).
-        font_hint_small = load_game_font(22)
-
-        title_bg = try_load_image(TITLESCREEN_BG_PATH, convert_alpha=False)
-        # Fallback to the uploaded screenshot if the absolute path isn't available on this machine.
-        char_bg = try_load_image(CHARSELECT_BG_PATH, convert_alpha=False) or try_load_image(
-            os.path.join(os.path.dirname(__file__), '46tooe.jpg'), convert_alpha=False
-        )
-        nate_thumb = try_load_image(NATE_SELECT_PATH, convert_alpha=True)
-        scorpion_thumb = try_load_image(SCORPION_SELECT_PATH, convert_alpha=True)
-        connor_thumb = try_load_image(CONNOR_SELECT_PATH, convert_alpha=True)
-        blake_thumb = try_load_image(BLAKE_SELECT_PATH, convert_alpha=True)
-
         # Menu selection
         menu_items = ['Single', 'Double', 'Quit']
         menu_index = 0
         game_mode = 'single'
 
-        def _js_instance_id(js: pygame.joystick.Joystick) -> int:
-            # pygame 2 uses instance ids; fall back safely.
-            try:
-                return js.get_instance_id()
-            except Exception:
-                try:
-                    return js.get_id()
-                except Exception:
-                    return -1
-
         # Helpers for menu/controller polling
-        def _poll_dpad(js: pygame.joystick.Joystick):
-            # Normalize to x=-1 left/+1 right; y=+1 up/-1 down
+        # D-pad readers. Pads report the d-pad as a hat, as axes 6/7 or as buttons 11-14
+        # (common SDL mapping); the left stick is always the last fallback. Each returns
+        # x=-1 left/+1 right; y=+1 up/-1 down. `axes` is an optional (axis 0, axis 1,
+        # axis 6, axis 7) snapshot the caller already read this frame.
+        def _dpad_hat(js: pygame.joystick.Joystick, axes):
+            return js.get_hat(0)
+
+        def _dpad_axes_67(js: pygame.joystick.Joystick, axes):
+            if axes is not None:
+                ax, ay = axes[2], axes[3]
+            else:
+                ax = js.get_axis(6)
+                ay = js.get_axis(7)
+            hx = -1 if ax < -0.5 else (1 if ax > 0.5 else 0)
+            hy = 1 if ay < -0.5 else (-1 if ay > 0.5 else 0)
+            return hx, hy
+
+        def _dpad_buttons_11_14(js: pygame.joystick.Joystick, axes):
+            up = js.get_button(11)
+            down = js.get_button(12)
+            left = js.get_button(13)
+            right = js.get_button(14)
+            hx = (-1 if left else 0) + (1 if right else 0)
+            hy = (1 if up else 0) + (-1 if down else 0)
+            return hx, hy
+
+        def _dpad_stick(js: pygame.joystick.Joystick, axes):
+            if axes is not None:
+                ax0, ay0 = axes[0], axes[1]
+            else:
+                ax0 = js.get_axis(0)
+                ay0 = js.get_axis(1)
+            hx = -1 if ax0 < -0.45 else (1 if ax0 > 0.45 else 0)
+            hy = 1 if ay0 < -0.45 else (-1 if ay0 > 0.45 else 0)
+            return hx, hy
+
+        # A pad's hats/axes/buttons are fixed for the life of its connection, so probe
+        # once per joystick instance and keep only the readers that apply. SDL doesn't
+        # reuse instance ids, so a re-plugged pad simply gets probed again.
+        dpad_readers: dict[int, tuple] = {}
+
+        def _probe_dpad(js: pygame.joystick.Joystick) -> tuple:
+            readers = []
             try:
                 if js.get_numhats() > 0:
-                    hx, hy = js.get_hat(0)
-                    if hx or hy:
-                        return hx, hy
-            except Exception:
-                pass
-            try:
-                # Some pads expose dpad on axes 6/7
+                    readers.append(_dpad_hat)
                 if js.get_numaxes() >= 8:
-                    ax = float(js.get_axis(6))
-                    ay = float(js.get_axis(7))
-                    hx = -1 if ax < -0.5 else (1 if ax > 0.5 else 0)
-                    hy = 1 if ay < -0.5 else (-1 if ay > 0.5 else 0)
-                    if hx or hy:
-                        return hx, hy
-            except Exception:
-                pass
-            try:
-                # Common SDL button mapping
+                    readers.append(_dpad_axes_67)
                 if js.get_numbuttons() >= 15:
-                    up = js.get_button(11)
-                    down = js.get_button(12)
-                    left = js.get_button(13)
-                    right = js.get_button(14)
-                    hx = (-1 if left else 0) + (1 if right else 0)
-                    hy = (1 if up else 0) + (-1 if down else 0)
-                    if hx or hy:
-                        return hx, hy
+                    readers.append(_dpad_buttons_11_14)
             except Exception:
                 pass
-            # Stick fallback
-            try:
-                ax0 = float(js.get_axis(0))
-                ay0 = float(js.get_axis(1))
-                hx = -1 if ax0 < -0.45 else (1 if ax0 > 0.45 else 0)
-                hy = 1 if ay0 < -0.45 else (-1 if ay0 > 0.45 else 0)
+            readers.append(_dpad_stick)
+            return tuple(readers)
+
+        def _poll_dpad(js: pygame.joystick.Joystick, axes: tuple[float, float, float, float] | None = None):
+            # Normalize to x=-1 left/+1 right; y=+1 up/-1 down
+            jid = _js_instance_id(js)
+            readers = dpad_readers.get(jid)
+            if readers is None:
+                readers = dpad_readers[jid] = _probe_dpad(js)
+            # Each source is guarded on its own so a failing reader can't hide the fallbacks.
+            for read in readers:
+                try:
+                    hx, hy = read(js, axes)
+                except Exception:
+                    continue
                 if hx or hy:
                     return hx, hy
-            except Exception:
-                pass
             return 0, 0
 
-        def _button_pressed(js: pygame.joystick.Joystick, idx: int, prev: dict[int, int]):
-            # Edge-detect a button press
-            try:
-                v = 1 if js.get_button(idx) else 0
-            except Exception:
-                v = 0
-            was = prev.get(idx, 0)
-            prev[idx] = v
-            return v == 1 and was == 0
-
         menu_next_nav_ms = 0
-        menu_btn_prev: dict[int, int] = {}
+        # The title menu is static: only redraw/flip when the selection changed
+        # (or the window needs repainting).
+        dirty = True
+        last_drawn_state = None
 
         while True:
-            clock.tick(FPS)
-            if title_bg is not None:
-                blit_scaled_fill(screen, title_bg)
-            else:
-                screen.fill(BLACK)
+            clock.tick(MENU_FPS)
+            state = (menu_index,)
+            if dirty or state != last_drawn_state:
+                if title_bg is not None:
+                    blit_scaled_fill(screen, title_bg)
+                else:
+                    screen.fill(BLACK)
 
-            # Title
-            title_surf = font_title.render('MK Ultra', True, TEXT_RED)
-            screen.blit(title_surf, (WIDTH // 2 - title_surf.get_width() // 2, 60))
+                # Title
+                title_surf = font_title.render('MK Ultra', True, TEXT_RED)
+                screen.blit(title_surf, (WIDTH // 2 - title_surf.get_width() // 2, 60))
 
-            # Menu items
-            start_y = 240
-            for i, label in enumerate(menu_items):
-                is_sel = (i == menu_index)
-                col = (255, 255, 0) if is_sel else WHITE
-                surf = font_menu.render(label, True, col)
-                screen.blit(surf, (WIDTH // 2 - surf.get_width() // 2, start_y + i * (surf.get_height() + MENU_ITEM_GAP)))
+                # Menu items
+                start_y = 240
+                for i, label in enumerate(menu_items):
+                    is_sel = (i == menu_index)
+                    col = (255, 255, 0) if is_sel else WHITE
+                    surf = font_menu.render(label, True, col)
+                    screen.blit(surf, (WIDTH // 2 - surf.get_width() // 2, start_y + i * (surf.get_height() + MENU_ITEM_GAP)))
 
-            hint = font_hint.render('ENTER / A to select  |  ESC / B to back', True, WHITE)
-                    # hint blit removed per request
+                hint = font_hint.render('ENTER / A to select  |  ESC / B to back', True, WHITE)
+                        # hint blit removed per request
 
-            pygame.display.flip()
+                pygame.display.flip()
+                last_drawn_state = state
+                dirty = False
 
             selected = False
-            # Keyboard events
-            for event in pygame.event.get():
-                if event.type == SOUND_MGR.MUSIC_END_EVENT:
-                    SOUND_MGR.handle_music_end_event()
+            SOUND_MGR.poll_music()
+            sticks = get_joysticks()
+            menu_jid = _js_instance_id(sticks[0]) if sticks else None
+            # Keyboard events: sleep until input arrives (or ~1 frame passes) instead of spinning.
+            events = [pygame.event.wait(int(1000 / MENU_FPS))]
+            events.extend(pygame.event.get())
+            for event in events:
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    dirty = True
+                    continue
+                if event.type in _JOY_DEVICE_EVENTS:
+                    mark_joysticks_stale()
                     continue
                 if event.type == pygame.QUIT:
                     return
+                # Controller A / B: the JOYBUTTONDOWN event is the press edge, no polling needed.
+                if event.type == pygame.JOYBUTTONDOWN and menu_jid is not None and not selected:
+                    if getattr(event, 'instance_id', getattr(event, 'joy', -999)) != menu_jid:
+                        continue
+                    if event.button == 0:  # A / Cross
+                        sel = menu_items[menu_index].lower()
+                        if sel == 'quit':
+                            return
+                        game_mode = 'double' if sel == 'double' else 'single'
+                        selected = True
+                    elif event.button == 1:  # B / Circle
+                        return
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         return
-                    if event.key in (pygame.K_w, pygame.K_UP):
+                    if event.key in _NAV_UP_KEYS:
                         menu_index = (menu_index - 1) % len(menu_items)
-                    if event.key in (pygame.K_s, pygame.K_DOWN):
+                    if event.key in _NAV_DOWN_KEYS:
                         menu_index = (menu_index + 1) % len(menu_items)
-                    if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                    if event.key in _NAV_CONFIRM_KEYS:
                         sel = menu_items[menu_index].lower()
                         if sel == 'quit':
                             return
                         game_mode = 'double' if sel == 'double' else 'single'
                         selected = True
 
-            # Controller polling (works even when hat events don't fire)
-            sticks = _get_connected_joysticks()
+            # Controller d-pad polling (works even when hat events don't fire)
             if sticks and not selected:
                 js = sticks[0]
                 now_ms = pygame.time.get_ticks()
@@ -5463,16 +6030,6 @@ def main() -> None:
                         menu_index = (menu_index + 1) % len(menu_items)
                         menu_next_nav_ms = now_ms + 160
 
-                if _button_pressed(js, 0, menu_btn_prev):  # A / Cross
-                    sel = menu_items[menu_index].lower()
-                    if sel == 'quit':
-                        return
-                    game_mode = 'double' if sel == 'double' else 'single'
-                    selected = True
-
-                if _button_pressed(js, 1, menu_btn_prev):  # B / Circle
-                    return
-
             if selected:
                 break
         # -----------------
@@ -5480,6 +6037,13 @@ def main() -> None:
         # -----------------
         def run_character_select(player_label: str, allow_cpu_difficulty: bool) -> int:
             nonlocal npc_difficulty
+            # Bind hot globals/attributes to locals once; the frame loop below runs 60x/sec.
+            get_ticks = pygame.time.get_ticks
+            event_wait = pygame.event.wait
+            event_get = pygame.event.get
+            idx_to_id = CHAR_INDEX_TO_ID
+            n_boxes = len(CHARSELECT_BOXES_SRC)
+            wait_ms = int(1000 / MENU_FPS)
             sel_index = 0
             cols = 5
             next_nav_ms = 0
@@ -5490,236 +6054,132 @@ def main() -> None:
             ui_armed = False
             # Edge-detect controller buttons so we don't auto-confirm if a button
             # is reported as held when a controller is plugged in / focused.
-            btn_prev: dict[int, int] = {}
+            btn_mask = 0
+            # DualSense mappings can vary across drivers, so L1/R1 use a small whitelist.
+            A_BIT = 1 << 0
+            B_BIT = 1 << 1
+            L1_MASK = (1 << 4) | (1 << 9)
+            R1_MASK = (1 << 5) | (1 << 10) | (1 << 11) | (1 << 7)
+            watch_buttons = (0, 1, 4, 5, 7, 9, 10, 11)
+            # Buttons pressed on this screen and not yet released (from JOYBUTTONDOWN/UP).
+            # Buttons already held on entry never produce an edge in btn_mask, so the
+            # event queue is enough to know when the pad is back to neutral.
+            held_buttons: set[int] = set()
             # Small debounce window on entering the screen to ignore any
             # residual/held inputs.
-            ignore_confirm_until = pygame.time.get_ticks() + 300
+            ignore_confirm_until = get_ticks() + 300
+            # Bottom prompt line 1 only changes with the CPU difficulty, so keep the
+            # rendered surface around and re-render when the percentage moves.
+            s1_pct = None
+            s1 = None
+            # Only redraw/flip when the selection, CPU difficulty or window changed.
+            dirty = True
+            last_drawn_state = None
+            # Screen-space (x, y, w, h, pad) per box, keyed by the background fit.
+            rect_cache: dict[tuple[float, float, int, int], list[tuple[int, int, int, int, int]]] = {}
+            # Portraits resized to their box, keyed by (box index, w, h). The resample only
+            # happens on a miss (first draw / resize), so keep the better smoothscale filter.
+            thumb_cache: dict[tuple[int, int, int], pygame.Surface] = {}
             while True:
-                clock.tick(FPS)
-                if char_bg is not None:
-                    sx, sy = blit_scaled_fill(screen, char_bg)
-                    off_x, off_y = 0, 0
-                else:
-                    screen.fill(GRAY)
-                    off_x, off_y, sx, sy = (0, 0, 1.0, 1.0)
-
-                # Draw Nate portrait in the first box if available
-                if nate_thumb is not None and len(CHARSELECT_BOXES_SRC) > 0:
-                    bx, by, bw, bh = CHARSELECT_BOXES_SRC[0]
-                    rx = int(off_x + bx * sx)
-                    ry = int(off_y + by * sy)
-                    rw = int(bw * sx)
-                    rh = int(bh * sy)
-                    pad = max(2, int(6 * min(sx, sy)))
-                    thumb = pygame.transform.smoothscale(nate_thumb, (max(1, rw - 2 * pad), max(1, rh - 2 * pad)))
-                    screen.blit(thumb, (rx + pad, ry + pad))
-
-                # Draw Scorpion portrait in the second box if available
-                if 'scorpion' in CHAR_ID_TO_CLASS and scorpion_thumb is not None and len(CHARSELECT_BOXES_SRC) > 1:
-                    bx, by, bw, bh = CHARSELECT_BOXES_SRC[1]
-                    rx = int(off_x + bx * sx)
-                    ry = int(off_y + by * sy)
-                    rw = int(bw * sx)
-                    rh = int(bh * sy)
-                    pad = max(2, int(6 * min(sx, sy)))
-                    thumb = pygame.transform.smoothscale(scorpion_thumb, (max(1, rw - 2 * pad), max(1, rh - 2 * pad)))
-                    screen.blit(thumb, (rx + pad, ry + pad))
-
-                # Draw Connor portrait in the third box if available
-                if 'connor' in CHAR_ID_TO_CLASS and connor_thumb is not None and len(CHARSELECT_BOXES_SRC) > 2:
-                    bx, by, bw, bh = CHARSELECT_BOXES_SRC[2]
-                    rx = int(off_x + bx * sx)
-                    ry = int(off_y + by * sy)
-                    rw = int(bw * sx)
-                    rh = int(bh * sy)
-                    pad = max(2, int(6 * min(sx, sy)))
-                    thumb = pygame.transform.smoothscale(connor_thumb, (max(1, rw - 2 * pad), max(1, rh - 2 * pad)))
-                    screen.blit(thumb, (rx + pad, ry + pad))
-
-                # Draw Blake portrait in the fourth box if available
-                if 'blake' in CHAR_ID_TO_CLASS and blake_thumb is not None and len(CHARSELECT_BOXES_SRC) > 3:
-                    bx, by, bw, bh = CHARSELECT_BOXES_SRC[3]
-                    rx = int(off_x + bx * sx)
-                    ry = int(off_y + by * sy)
-                    rw = int(bw * sx)
-                    rh = int(bh * sy)
-                    pad = max(2, int(6 * min(sx, sy)))
-                    thumb = pygame.transform.smoothscale(blake_thumb, (max(1, rw - 2 * pad), max(1, rh - 2 * pad)))
-                    screen.blit(thumb, (rx + pad, ry + pad))
-
-                # Highlight selected box
-                if 0 <= sel_index < len(CHARSELECT_BOXES_SRC):
-                    bx, by, bw, bh = CHARSELECT_BOXES_SRC[sel_index]
-                    rx = int(off_x + bx * sx)
-                    ry = int(off_y + by * sy)
-                    rw = int(bw * sx)
-                    rh = int(bh * sy)
-                    pygame.draw.rect(screen, BLACK, (rx - 3, ry - 3, rw + 6, rh + 6), 8)
-
-                # Bottom prompts (TWO LINES so it never runs off-screen)
-                if allow_cpu_difficulty:
-                    pct = int(round(npc_difficulty * 100))
-                    bar_len = 10
-                    filled = int(round(npc_difficulty * bar_len))
-                    bar = '[' + '=' * filled + '-' * (bar_len - filled) + ']'
-                    line1 = f'{player_label} SELECT  |  CPU {bar} {pct}%'
-                    line2 = 'ENTER/A confirm  |  ESC/B back  |  L1 decrease CPU  |  R1 increase CPU  |  B/N (kb) adjust'
-                else:
-                    line1 = f'{player_label} SELECT'
-                    line2 = 'ENTER / A confirm  |  ESC / B back'
-
-                s1 = font_hint.render(line1, True, WHITE)
-                s2 = font_hint_small.render(line2, True, WHITE)
-                strip_h = int(max(s1.get_height() + s2.get_height() + 22, 72))
-                strip = pygame.Surface((WIDTH, strip_h), pygame.SRCALPHA)
-                strip.fill((0, 0, 0, 190))
-                screen.blit(strip, (0, HEIGHT - strip_h))
-                y2 = HEIGHT - s2.get_height() - 10
-                y1 = y2 - s1.get_height() - 6
-                screen.blit(s1, (WIDTH // 2 - s1.get_width() // 2, y1))
-                screen.blit(s2, (WIDTH // 2 - s2.get_width() // 2, y2))
-
-                pygame.display.flip()
+                clock.tick(MENU_FPS)
+                state = (sel_index, int(round(npc_difficulty * 100)))
+                if dirty or state != last_drawn_state:
+                    if char_bg is not None:
+                        sx, sy = blit_scaled_fill(screen, char_bg)
+                        off_x, off_y = 0, 0
+                    else:
+                        screen.fill(GRAY)
+                        off_x, off_y, sx, sy = (0, 0, 1.0, 1.0)
+
+                    fit_key = (sx, sy, off_x, off_y)
+                    scaled_boxes = rect_cache.get(fit_key)
+                    if scaled_boxes is None:
+                        pad = max(2, int(6 * min(sx, sy)))
+                        scaled_boxes = [
+                            (int(off_x + bx * sx), int(off_y + by * sy), int(bw * sx), int(bh * sy), pad)
+                            for (bx, by, bw, bh) in CHARSELECT_BOXES_SRC
+                        ]
+                        rect_cache[fit_key] = scaled_boxes
+
+                    # Draw each character portrait in its box (if available)
+                    for i, (cid, thumb_src) in enumerate(portrait_data):
+                        if thumb_src is None or cid not in CHAR_ID_TO_CLASS or i >= len(scaled_boxes):
+                            continue
+                        rx, ry, rw, rh, pad = scaled_boxes[i]
+                        tw, th = max(1, rw - 2 * pad), max(1, rh - 2 * pad)
+                        thumb = thumb_cache.get((i, tw, th))
+                        if thumb is None:
+                            thumb = pygame.transform.smoothscale(thumb_src, (tw, th))
+                            thumb_cache[(i, tw, th)] = thumb
+                        screen.blit(thumb, (rx + pad, ry + pad))
+
+                    # Highlight selected box
+                    if 0 <= sel_index < len(scaled_boxes):
+                        rx, ry, rw, rh, _pad = scaled_boxes[sel_index]
+                        pygame.draw.rect(screen, BLACK, (rx - 3, ry - 3, rw + 6, rh + 6), 8)
+
+                    # Bottom prompts (TWO LINES so it never runs off-screen)
+                    if allow_cpu_difficulty:
+                        pct = int(round(npc_difficulty * 100))
+                        line2 = 'ENTER/A confirm  |  ESC/B back  |  L1 decrease CPU  |  R1 increase CPU  |  B/N (kb) adjust'
+                    else:
+                        pct = -1
+                        line2 = 'ENTER / A confirm  |  ESC / B back'
 
-                # --- Controller polling (navigation works even if d-pad doesn't emit hat events) ---
-                sticks = _get_connected_joysticks()
+                    if s1 is None or pct != s1_pct:
+                        if allow_cpu_difficulty:
+                            bar = CPU_BAR_STRINGS[int(round(npc_difficulty * CPU_BAR_LEN))]
+                            line1 = f'{player_label} SELECT  |  CPU {bar} {pct}%'
+                        else:
+                            line1 = f'{player_label} SELECT'
+                        s1 = font_hint.render(line1, True, WHITE)
+                        s1_pct = pct
+                    s2 = font_hint_small.render(line2, True, WHITE)
+                    strip_h = int(max(s1.get_height() + s2.get_height() + 22, 72))
+                    strip = pygame.Surface((WIDTH, strip_h), pygame.SRCALPHA)
+                    strip.fill((0, 0, 0, 190))
+                    screen.blit(strip, (0, HEIGHT - strip_h))
+                    y2 = HEIGHT - s2.get_height() - 10
+                    y1 = y2 - s1.get_height() - 6
+                    screen.blit(s1, (WIDTH // 2 - s1.get_width() // 2, y1))
+                    screen.blit(s2, (WIDTH // 2 - s2.get_width() // 2, y2))
+
+                    pygame.display.flip()
+                    last_drawn_state = state
+                    dirty = False
+
+                SOUND_MGR.poll_music()
+                # Sleep until input arrives (or ~1 frame passes); the pad is still polled below.
+                events = [event_wait(wait_ms)]
+                events.extend(event_get())
+                # One timestamp per frame (taken after the wait), shared by every debounce check below.
+                frame_now_ms = get_ticks()
+                # Pad this screen reads: P2 uses the second pad when there is one.
+                sticks = get_joysticks()
                 js_poll = None
                 if sticks:
                     if player_label == 'P2' and len(sticks) > 1:
                         js_poll = sticks[1]
                     else:
                         js_poll = sticks[0]
-                now_ms = pygame.time.get_ticks()
-                # Determine whether the controller is "neutral".
-                if js_poll is not None and not ui_armed:
-                    try:
-                        # No d-pad direction
-                        hx0, hy0 = _poll_dpad(js_poll)
-                        # Sticks near center
-                        ax0 = float(js_poll.get_axis(0)) if js_poll.get_numaxes() > 0 else 0.0
-                        ay0 = float(js_poll.get_axis(1)) if js_poll.get_numaxes() > 1 else 0.0
-                        neutral_sticks = (abs(ax0) < 0.25 and abs(ay0) < 0.25)
-                        # No buttons held
-                        neutral_buttons = True
-                        for bi in range(js_poll.get_numbuttons()):
-                            if js_poll.get_button(bi):
-                                neutral_buttons = False
-                                break
-                        if hx0 == 0 and hy0 == 0 and neutral_sticks and neutral_buttons:
-                            ui_armed = True
-                            # Initialize previous button states at arm-time so held buttons
-                            # don't register as an immediate edge-press.
-                            try:
-                                btn_prev[0] = 1 if js_poll.get_button(0) else 0
-                                btn_prev[1] = 1 if js_poll.get_button(1) else 0
-                                # Also extend the confirm debounce a bit after arming.
-                                ignore_confirm_until = max(ignore_confirm_until, pygame.time.get_ticks() + 250)
-                            except Exception:
-                                pass
-                    except Exception:
-                        ui_armed = True
-                if js_poll is not None and now_ms >= next_nav_ms:
-                    # d-pad via hat / axes / buttons
-                    try:
-                        hx, hy = (js_poll.get_hat(0) if js_poll.get_numhats() > 0 else (0, 0))
-                    except Exception:
-                        hx, hy = (0, 0)
-                    if hx == 0 and hy == 0:
-                        try:
-                            if js_poll.get_numaxes() >= 8:
-                                ax = float(js_poll.get_axis(6))
-                                ay = float(js_poll.get_axis(7))
-                                hx = -1 if ax < -0.5 else (1 if ax > 0.5 else 0)
-                                hy = 1 if ay < -0.5 else (-1 if ay > 0.5 else 0)
-                        except Exception:
-                            pass
-                    if hx == 0 and hy == 0:
-                        try:
-                            if js_poll.get_numbuttons() >= 15:
-                                up = js_poll.get_button(11)
-                                down = js_poll.get_button(12)
-                                left = js_poll.get_button(13)
-                                right = js_poll.get_button(14)
-                                hx = (-1 if left else 0) + (1 if right else 0)
-                                hy = (1 if up else 0) + (-1 if down else 0)
-                        except Exception:
-                            pass
-                    # also allow left stick navigation
-                    if hx == 0 and hy == 0:
-                        try:
-                            ax0 = float(js_poll.get_axis(0))
-                            ay0 = float(js_poll.get_axis(1))
-                            dead = 0.55
-                            if ax0 < -dead:
-                                hx = -1
-                            elif ax0 > dead:
-                                hx = 1
-                            if ay0 < -dead:
-                                hy = 1
-                            elif ay0 > dead:
-                                hy = -1
-                        except Exception:
-                            pass
-                    if hx < 0:
-                        sel_index = (sel_index - 1) % len(CHARSELECT_BOXES_SRC)
-                        next_nav_ms = now_ms + 160
-                    elif hx > 0:
-                        sel_index = (sel_index + 1) % len(CHARSELECT_BOXES_SRC)
-                        next_nav_ms = now_ms + 160
-                    elif hy > 0:
-                        sel_index = (sel_index - cols) % len(CHARSELECT_BOXES_SRC)
-                        next_nav_ms = now_ms + 180
-                    elif hy < 0:
-                        sel_index = (sel_index + cols) % len(CHARSELECT_BOXES_SRC)
-                        next_nav_ms = now_ms + 180
-
-                # confirm/back + CPU diff polling (controller)
-                if js_poll is not None and ui_armed:
-                    try:
-                        # Confirm/back should be edge-triggered and debounced.
-                        if now_ms >= ignore_confirm_until:
-                            if _button_pressed(js_poll, 1, btn_prev):  # B / Circle
-                                return -2
-                            if _button_pressed(js_poll, 0, btn_prev):  # A / Cross
-                                if sel_index in CHAR_INDEX_TO_ID:
-                                    return sel_index
-                        else:
-                            # Still update prev state during debounce.
-                            _button_pressed(js_poll, 0, btn_prev)
-                            _button_pressed(js_poll, 1, btn_prev)
-
-                        # CPU difficulty adjustment uses L1/R1.
-                        if allow_cpu_difficulty and now_ms >= next_diff_ms:
-                            # DualSense mappings can vary across drivers, so use a small whitelist.
-                            l1_btns = (4, 9)
-                            r1_btns = (5, 10, 11, 7)
-                            dec = False
-                            inc = False
-                            nb = 0
-                            try:
-                                nb = js_poll.get_numbuttons()
-                            except Exception:
-                                nb = 0
-                            for b in l1_btns:
-                                if 0 <= b < nb and js_poll.get_button(b):
-                                    dec = True
-                                    break
-                            for b in r1_btns:
-                                if 0 <= b < nb and js_poll.get_button(b):
-                                    inc = True
-                                    break
-                            if dec:
-                                npc_difficulty = max(0.0, npc_difficulty - 0.05)
-                                next_diff_ms = now_ms + 160
-                            elif inc:
-                                npc_difficulty = min(1.0, npc_difficulty + 0.05)
-                                next_diff_ms = now_ms + 160
-                    except Exception:
-                        pass
-
-                for event in pygame.event.get():
-                    if event.type == SOUND_MGR.MUSIC_END_EVENT:
-                        SOUND_MGR.handle_music_end_event()
+                poll_jid = _js_instance_id(js_poll) if js_poll is not None else None
+                for event in events:
+                    if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                        dirty = True
+                        continue
+                    if event.type in _JOY_DEVICE_EVENTS:
+                        mark_joysticks_stale()
+                        if event.type == pygame.JOYDEVICEREMOVED:
+                            # A release lost to the unplug must not keep arming blocked.
+                            held_buttons.clear()
+                        continue
+                    if event.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+                        # Only this screen's pad gates arming (P1's held buttons don't block P2).
+                        if getattr(event, 'instance_id', getattr(event, 'joy', -999)) == poll_jid:
+                            if event.type == pygame.JOYBUTTONDOWN:
+                                held_buttons.add(event.button)
+                            else:
+                                held_buttons.discard(event.button)
                         continue
                     if event.type == pygame.QUIT:
                         return -1
@@ -5737,343 +6197,98 @@ def main() -> None:
                                 npc_difficulty = min(1.0, npc_difficulty + step)
                             continue
 
-                        if event.key in (pygame.K_a, pygame.K_LEFT):
-                            sel_index = (sel_index - 1) % len(CHARSELECT_BOXES_SRC)
-                        if event.key in (pygame.K_d, pygame.K_RIGHT):
-                            sel_index = (sel_index + 1) % len(CHARSELECT_BOXES_SRC)
-                        if event.key in (pygame.K_w, pygame.K_UP):
-                            sel_index = (sel_index - cols) % len(CHARSELECT_BOXES_SRC)
-                        if event.key in (pygame.K_s, pygame.K_DOWN):
-                            sel_index = (sel_index + cols) % len(CHARSELECT_BOXES_SRC)
-                        if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                            if sel_index in CHAR_INDEX_TO_ID:
+                        if event.key in _NAV_LEFT_KEYS:
+                            sel_index = (sel_index - 1) % n_boxes
+                        if event.key in _NAV_RIGHT_KEYS:
+                            sel_index = (sel_index + 1) % n_boxes
+                        if event.key in _NAV_UP_KEYS:
+                            sel_index = (sel_index - cols) % n_boxes
+                        if event.key in _NAV_DOWN_KEYS:
+                            sel_index = (sel_index + cols) % n_boxes
+                        if event.key in _NAV_CONFIRM_KEYS:
+                            if sel_index in idx_to_id:
                                 return sel_index
 
-                    # Controller support
-                    if event.type in (pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION, pygame.JOYAXISMOTION):
-                        sticks = _get_connected_joysticks()
-                        js = None
-                        if sticks:
-                            if player_label == 'P2' and len(sticks) > 1:
-                                js = sticks[1]
-                            else:
-                                js = sticks[0]
-                        if js is None:
-                            continue
-                        jid = _js_instance_id(js)
-                        e_jid = getattr(event, 'instance_id', getattr(event, 'joy', -999))
-                        if e_jid != jid:
-                            continue
+                # --- Controller polling (one pass per frame) ---
+                # Polling handles d-pads that report as hat, axes or buttons (e.g. PS5) and
+                # works even when the pad doesn't emit hat/axis events reliably.
+                if js_poll is not None:
+                    now_ms = frame_now_ms
+                    # Capability counts are SDL calls; query them once per frame.
+                    try:
+                        nb = js_poll.get_numbuttons()
+                        na = js_poll.get_numaxes()
+                    except Exception:
+                        nb, na = 0, 0
+                    # Left stick + d-pad axes, read once and shared by every check below.
+                    try:
+                        axes = tuple(js_poll.get_axis(i) if i < na else 0.0 for i in (0, 1, 6, 7))
+                    except Exception:
+                        axes = (0.0, 0.0, 0.0, 0.0)
+                    hx, hy = _poll_dpad(js_poll, axes)
+
+                    # Arm controller UI inputs only once the pad is neutral.
+                    if not ui_armed:
+                        try:
+                            # Sticks near center
+                            neutral_sticks = (abs(axes[0]) < 0.25 and abs(axes[1]) < 0.25)
+                            if hx == 0 and hy == 0 and neutral_sticks and not held_buttons:
+                                ui_armed = True
+                                # Also extend the confirm debounce a bit after arming.
+                                ignore_confirm_until = max(ignore_confirm_until, now_ms + 250)
+                        except Exception:
+                            ui_armed = True
 
-                        now_ms = pygame.time.get_ticks()
-
-                        # D-pad navigation (hat)
-                        if event.type == pygame.JOYHATMOTION and now_ms >= next_nav_ms:
-                            hx, hy = event.value
-                            if hx < 0:
-                                sel_index = (sel_index - 1) % len(CHARSELECT_BOXES_SRC)
-                                next_nav_ms = now_ms + 140
-                            elif hx > 0:
-                                sel_index = (sel_index + 1) % len(CHARSELECT_BOXES_SRC)
-                                next_nav_ms = now_ms + 140
-                            elif hy > 0:
-                                sel_index = (sel_index - cols) % len(CHARSELECT_BOXES_SRC)
-                                next_nav_ms = now_ms + 160
-                            elif hy < 0:
-                                sel_index = (sel_index + cols) % len(CHARSELECT_BOXES_SRC)
-                                next_nav_ms = now_ms + 160
-
-                        # Left stick navigation (axes 0/1)
-                        if event.type == pygame.JOYAXISMOTION and now_ms >= next_nav_ms:
-                            if event.axis in (0, 1):
-                                v = float(event.value)
-                                dead = 0.45
-                                if event.axis == 0:
-                                    if v < -dead:
-                                        sel_index = (sel_index - 1) % len(CHARSELECT_BOXES_SRC)
-                                        next_nav_ms = now_ms + 140
-                                    elif v > dead:
-                                        sel_index = (sel_index + 1) % len(CHARSELECT_BOXES_SRC)
-                                        next_nav_ms = now_ms + 140
-                                else:
-                                    if v < -dead:
-                                        sel_index = (sel_index - cols) % len(CHARSELECT_BOXES_SRC)
-                                        next_nav_ms = now_ms + 160
-                                    elif v > dead:
-                                        sel_index = (sel_index + cols) % len(CHARSELECT_BOXES_SRC)
-                                        next_nav_ms = now_ms + 160
-
-                        # Buttons: A confirm, B back
-                        if event.type == pygame.JOYBUTTONDOWN:
-                            # Debounce/arm so plugging in a controller or
-                            # held inputs from the previous screen don't auto-confirm.
-                            if not ui_armed or now_ms < ignore_confirm_until:
-                                # Still update edge state.
-                                _button_pressed(js, 0, btn_prev)
-                                _button_pressed(js, 1, btn_prev)
-                                continue
-                            if event.button == 1:
-                                return -2
-                            if event.button == 0:
-                                if sel_index in CHAR_INDEX_TO_ID:
-                                    return sel_index
-
-                            # CPU difficulty (NPC select only): controller L1/R1 adjust.
-                            if allow_cpu_difficulty and now_ms >= next_diff_ms:
-                                l1_btns = (4, 9)
-                                r1_btns = (5, 10, 11, 7)
-                                if event.button in l1_btns:
-                                    npc_difficulty = max(0.0, npc_difficulty - 0.05)
-                                    next_diff_ms = now_ms + 120
-                                elif event.button in r1_btns:
-                                    npc_difficulty = min(1.0, npc_difficulty + 0.05)
-                                    next_diff_ms = now_ms + 120
-
-                # --- Controller polling fallback (handles PS5 d-pad as buttons/axes, even if events don't fire)
-                sticks = _get_connected_joysticks()
-                js = None
-                if sticks:
-                    if player_label == 'P2' and len(sticks) > 1:
-                        js = sticks[1]
-                    else:
-                        js = sticks[0]
-                if js is not None:
-                    now_ms = pygame.time.get_ticks()
-                    hx, hy = _poll_dpad(js)
                     if now_ms >= next_nav_ms:
                         if hx < 0:
-                            sel_index = (sel_index - 1) % len(CHARSELECT_BOXES_SRC)
+                            sel_index = (sel_index - 1) % n_boxes
                             next_nav_ms = now_ms + 140
                         elif hx > 0:
-                            sel_index = (sel_index + 1) % len(CHARSELECT_BOXES_SRC)
+                            sel_index = (sel_index + 1) % n_boxes
                             next_nav_ms = now_ms + 140
                         elif hy > 0:
-                            sel_index = (sel_index - cols) % len(CHARSELECT_BOXES_SRC)
+                            sel_index = (sel_index - cols) % n_boxes
                             next_nav_ms = now_ms + 160
                         elif hy < 0:
-                            sel_index = (sel_index + cols) % len(CHARSELECT_BOXES_SRC)
+                            sel_index = (sel_index + cols) % n_boxes
                             next_nav_ms = now_ms + 160
 
+                    # Button state as a bitmask (bit b = button b held); one AND-NOT finds
+                    # every new press at once. The mask is updated every frame, including
+                    # while unarmed/debouncing, so arming never creates a synthetic edge.
+                    cur_mask = 0
+                    try:
+                        for b in watch_buttons:
+                            if b < nb and js_poll.get_button(b):
+                                cur_mask |= 1 << b
+                    except Exception:
+                        pass
+                    pressed = cur_mask & ~btn_mask
+                    btn_mask = cur_mask
+
                     # Confirm/back (only when armed + past debounce)
                     if ui_armed and now_ms >= ignore_confirm_until:
-                        if _button_pressed(js, 0, btn_prev):
-                            if sel_index in CHAR_INDEX_TO_ID:
+                        if pressed & A_BIT:  # A / Cross
+                            if sel_index in idx_to_id:
                                 return sel_index
-                        if _button_pressed(js, 1, btn_prev):
+                        if pressed & B_BIT:  # B / Circle
                             return -2
 
-                        # CPU difficulty via L1/R1 during NPC select
-                        if allow_cpu_difficulty and now_ms >= next_diff_ms:
-                            l1_btns = (4, 9)
-                            r1_btns = (5, 10, 11, 7)
-                            dec = any(_button_pressed(js, b, btn_prev) for b in l1_btns)
-                            inc = any(_button_pressed(js, b, btn_prev) for b in r1_btns)
-                            if dec:
+                        # CPU difficulty via L1/R1 during NPC select. A press edge always steps
+                        # (outside the repeat window, so a quick tap is never swallowed); holding
+                        # the shoulder then repeats every 160ms.
+                        if allow_cpu_difficulty:
+                            if pressed & L1_MASK or (now_ms >= next_diff_ms and cur_mask & L1_MASK):
                                 npc_difficulty = max(0.0, npc_difficulty - 0.05)
-                                next_diff_ms = now_ms + 120
-                            elif inc:
+                                next_diff_ms = now_ms + 160
+                            elif pressed & R1_MASK or (now_ms >= next_diff_ms and cur_mask & R1_MASK):
                                 npc_difficulty = min(1.0, npc_difficulty + 0.05)
-                                next_diff_ms = now_ms + 120
-                    else:
-                        # During debounce/unarmed, keep prev state updated so we don't
-                        # create a synthetic edge when arming completes.
-                        _button_pressed(js, 0, btn_prev)
-                        _button_pressed(js, 1, btn_prev)
-                        if allow_cpu_difficulty:
-                            for b in (4, 5, 6, 7, 8, 9, 10, 11):
-                                _button_pressed(js, b, btn_prev)
+                                next_diff_ms = now_ms + 160
 
         
         # -----------------
         # STAGE SELECT
         # -----------------
-        def run_stage_select(font_mid):
-            """Return selected stage key or None to go back."""
-            stage_dir = '/Users/blake/Documents/Mac_Code/MKUltra/stages'
-            discovered = discover_stage_images(stage_dir)
-            stage_keys = []
-            stage_paths = {}
-
-            # Include known stages first
-            for k, cfg in STAGES.items():
-                stage_keys.append(k)
-                bgname = cfg.get('bg', k)
-                for ext in ('.png', '.jpg', '.jpeg', '.gif'):
-                    p = os.path.join(stage_dir, bgname + ext)
-                    if os.path.exists(p):
-                        stage_paths[k] = p
-                        break
-
-            # Add discovered images (auto-register)
-            for k, p in discovered:
-                if k not in stage_keys:
-                    stage_keys.append(k)
-                    stage_paths[k] = p
-                if k not in STAGES:
-                    STAGES[k] = {'bg': k, 'ground_y': DEFAULT_GROUND_Y}
-
-            if not stage_keys:
-                return DEFAULT_STAGE_NAME
-
-            bg_img = try_load_image(STAGESELECT_BG_PATH, convert_alpha=False) or try_load_image(
-                os.path.join(os.path.dirname(__file__), 'StageSelect.jpeg'), convert_alpha=False
-            )
-            bg_img = pygame.transform.scale(bg_img, (WIDTH, HEIGHT))
-
-            # Template is 600x600 with borders near x=116,295,484 and y=115,301,484
-            tW, tH = 600, 600
-            pad = 6
-            xL, xM, xR = 116, 295, 484
-            yT, yM, yB = 115, 301, 484
-            rects_t = [
-                pygame.Rect(xL+pad, yT+pad, (xM-xL)-2*pad, (yM-yT)-2*pad),
-                pygame.Rect(xM+pad, yT+pad, (xR-xM)-2*pad, (yM-yT)-2*pad),
-                pygame.Rect(xL+pad, yM+pad, (xM-xL)-2*pad, (yB-yM)-2*pad),
-                pygame.Rect(xM+pad, yM+pad, (xR-xM)-2*pad, (yB-yM)-2*pad),
-            ]
-            sx = WIDTH / tW
-            sy = HEIGHT / tH
-            rects = [pygame.Rect(int(r.x*sx), int(r.y*sy), int(r.w*sx), int(r.h*sy)) for r in rects_t]
-
-            previews = {}
-            for k in stage_keys[:4]:
-                p = stage_paths.get(k)
-                surf = try_load_image(p, convert_alpha=False) if p else None
-                if surf is None:
-                    # fallback to a flat surface if missing
-                    surf = pygame.Surface((600, 600))
-                    surf.fill((60, 60, 60))
-                previews[k] = surf
-
-            sel = 0
-            # Controller navigation (single-screen UI)
-            next_nav_ms = 0
-            ignore_confirm_until = pygame.time.get_ticks() + 250
-            btn_prev = {0: False, 1: False}  # A=0, B=1 edge tracking
-            while True:
-                clock.tick(FPS)
-                for event in pygame.event.get():
-                    if event.type == SOUND_MGR.MUSIC_END_EVENT:
-                        SOUND_MGR.handle_music_end_event()
-                        continue
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit(0)
-                    if event.type == pygame.KEYDOWN:
-                        if event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE):
-                            return None
-                        if event.key == pygame.K_RETURN:
-                            return stage_keys[sel]
-                        if event.key in (pygame.K_LEFT, pygame.K_a):
-                            sel = (sel - 1) % min(4, len(stage_keys))
-                        if event.key in (pygame.K_RIGHT, pygame.K_d):
-                            sel = (sel + 1) % min(4, len(stage_keys))
-                        if event.key in (pygame.K_UP, pygame.K_w):
-                            sel = (sel - 2) % min(4, len(stage_keys))
-                        if event.key in (pygame.K_DOWN, pygame.K_s):
-                            sel = (sel + 2) % min(4, len(stage_keys))
-                    # Controller support (D-pad / left stick / A confirm / B back)
-                    if event.type in (pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION, pygame.JOYAXISMOTION):
-                        sticks = _get_connected_joysticks()
-                        js = sticks[0] if sticks else None
-                        if js is not None:
-                            jid = _js_instance_id(js)
-                            e_jid = getattr(event, 'instance_id', getattr(event, 'joy', -999))
-                            if e_jid == jid:
-                                now_ms = pygame.time.get_ticks()
-
-                                # D-pad navigation (hat)
-                                if event.type == pygame.JOYHATMOTION and now_ms >= next_nav_ms:
-                                    hx, hy = event.value
-                                    if hx < 0:
-                                        sel = (sel - 1) % min(4, len(stage_keys))
-                                        next_nav_ms = now_ms + 140
-                                    elif hx > 0:
-                                        sel = (sel + 1) % min(4, len(stage_keys))
-                                        next_nav_ms = now_ms + 140
-                                    elif hy > 0:
-                                        sel = (sel - 2) % min(4, len(stage_keys))
-                                        next_nav_ms = now_ms + 160
-                                    elif hy < 0:
-                                        sel = (sel + 2) % min(4, len(stage_keys))
-                                        next_nav_ms = now_ms + 160
-
-                                # Left stick navigation (axes 0/1)
-                                if event.type == pygame.JOYAXISMOTION and now_ms >= next_nav_ms:
-                                    if event.axis in (0, 1):
-                                        v = float(event.value)
-                                        dead = 0.45
-                                        if event.axis == 0:
-                                            if v < -dead:
-                                                sel = (sel - 1) % min(4, len(stage_keys))
-                                                next_nav_ms = now_ms + 140
-                                            elif v > dead:
-                                                sel = (sel + 1) % min(4, len(stage_keys))
-                                                next_nav_ms = now_ms + 140
-                                        else:
-                                            if v < -dead:
-                                                sel = (sel - 2) % min(4, len(stage_keys))
-                                                next_nav_ms = now_ms + 160
-                                            elif v > dead:
-                                                sel = (sel + 2) % min(4, len(stage_keys))
-                                                next_nav_ms = now_ms + 160
-
-                                # Buttons: B back, A confirm (edge + debounce)
-                                if event.type == pygame.JOYBUTTONDOWN:
-                                    # update edge state
-                                    a_edge = _button_pressed(js, 0, btn_prev)
-                                    b_edge = _button_pressed(js, 1, btn_prev)
-
-                                    if now_ms < ignore_confirm_until:
-                                        continue
-
-                                    if event.button == 1 and b_edge:
-                                        return None
-                                    if event.button == 0 and a_edge:
-                                        return stage_keys[sel]
-
-                    # Controller polling fallback (some mappings don't emit hat events reliably)
-                    sticks = _get_connected_joysticks()
-                    js = sticks[0] if sticks else None
-                    if js is not None:
-                        now_ms = pygame.time.get_ticks()
-                        hx, hy = _poll_dpad(js)
-                        if now_ms >= next_nav_ms:
-                            if hx < 0:
-                                sel = (sel - 1) % min(4, len(stage_keys))
-                                next_nav_ms = now_ms + 140
-                            elif hx > 0:
-                                sel = (sel + 1) % min(4, len(stage_keys))
-                                next_nav_ms = now_ms + 140
-                            elif hy > 0:
-                                sel = (sel - 2) % min(4, len(stage_keys))
-                                next_nav_ms = now_ms + 160
-                            elif hy < 0:
-                                sel = (sel + 2) % min(4, len(stage_keys))
-                                next_nav_ms = now_ms + 160
-                    if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                        mx, my = event.pos
-                        for i, r in enumerate(rects):
-                            if i < len(stage_keys) and r.collidepoint(mx, my):
-                                sel = i
-                                return stage_keys[sel]
-
-                screen.blit(bg_img, (0, 0))
-                for i, r in enumerate(rects):
-                    if i >= len(stage_keys):
-                        continue
-                    k = stage_keys[i]
-                    pv = previews.get(k)
-                    if pv is not None:
-                        screen.blit(pygame.transform.scale(pv, (r.w, r.h)), r.topleft)
-                    if i == sel:
-                        pygame.draw.rect(screen, (255, 215, 0), r, 4)
-
-                label = stage_keys[sel]
-                txt = font_mid.render(label, True, (255, 255, 255))
-                screen.blit(txt, (WIDTH//2 - txt.get_width()//2, int(HEIGHT*0.85)))
-                pygame.display.flip()
-
 # P1 always chooses first (same flow for both Single + Double).
         p1_sel = run_character_select('P1', allow_cpu_difficulty=False)
         if p1_sel == -1:
@@ -6099,7 +6314,7 @@ def main() -> None:
 
         # Stage selection (after fighters are chosen)
         # Ensure fonts exist before stage select
-        stage_choice = run_stage_select(font_mid)
+        stage_choice = run_stage_select(screen, clock, font_mid, _poll_dpad)
         if stage_choice is None:
             continue
         stage_name = stage_choice
@@ -6134,7 +6349,6 @@ def main() -> None:
             },
             facing_right=True,
         )
-
         # Convenience mapping for p2 while testing
         p2 = p2_cls(
             x=WIDTH - 40 - PLAYER_W,
@@ -6160,7 +6374,7 @@ def main() -> None:
         # Controller assignments (auto):
         # - If at least 1 controller is connected, it drives P1.
         # - If 2+ controllers are connected AND game_mode=='double', controller #2 drives P2.
-        sticks = _get_connected_joysticks()
+        sticks = get_joysticks()
         p1_controller = ControllerProvider(sticks[0], p1.controls) if len(sticks) >= 1 else None
         p2_controller = ControllerProvider(sticks[1], p2.controls) if (game_mode == 'double' and len(sticks) >= 2) else None
 
@@ -6257,6 +6471,15 @@ def main() -> None:
         # =====================
         ROUND_SECONDS = 90
         ROUND_OVER_PAUSE_MS = 2500  # brief pause between rounds
+        # Round-end outcomes as (winner, loser, reason) indices into (p1, p2, None).
+        # KO: keyed by (p1 KO'd, p2 KO'd); a double KO is a draw.
+        # Time over: indexed by cmp(p1.health, p2.health) + 1; equal health is a draw.
+        KO_OUTCOMES = {
+            (True, True): (2, 2, 'draw'),
+            (False, True): (0, 1, 'ko'),
+            (True, False): (1, 0, 'ko'),
+        }
+        TIME_OVER_OUTCOMES = ((1, 0, 'time'), (2, 2, 'draw'), (0, 1, 'time'))
 
         # Match state
         match_state = 'intro'  # intro / fighting / paused / round_over / match_over
@@ -6269,6 +6492,9 @@ def main() -> None:
         round_winner: Fighter | None = None
         round_loser: Fighter | None = None
         round_result_reason = ''  # 'ko' / 'time' / 'draw'
+        # Result text blits, built once when the round / match ends rather than every frame.
+        round_over_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        match_over_blits: list[tuple[pygame.Surface, tuple[int, int]]] | None = None
 
         # =====================
         # PAUSE MENU
@@ -6278,25 +6504,54 @@ def main() -> None:
         pause_view = 'main'  # 'main' or 'options'
         pause_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         pause_overlay.fill((60, 60, 60, 160))  # transparent grey
+        # Static parts of both pause views composited once onto the overlay;
+        # per frame only the background and the menu items get blitted.
+        pause_main_bg = pause_overlay.copy()
+        title_surf, title_surf_hw = render_cached(font_mid, 'PAUSED', WHITE)
+        pause_main_bg.blit(title_surf, (WIDTH//2 - title_surf_hw, 140))
+        pause_options_bg = pause_overlay.copy()
+        title_surf, title_surf_hw = render_cached(font_mid, 'OPTIONS', WHITE)
+        pause_options_bg.blit(title_surf, (WIDTH//2 - title_surf_hw, 140))
+        msg, msg_hw = render_cached(font_small, 'Coming soon...', WHITE)
+        pause_options_bg.blit(msg, (WIDTH//2 - msg_hw, 230))
+        # Menu items pre-rendered both ways: pause_item_blits[i][is_selected] -> (surf, pos)
+        pause_item_blits = []
+        for i, item in enumerate(pause_menu_items):
+            pair = []
+            for color in (WHITE, (255, 255, 0)):
+                s, s_hw = render_cached(font_small, item, color)
+                pair.append((s, (WIDTH//2 - s_hw, 220 + i * 40)))
+            pause_item_blits.append(tuple(pair))
         pause_started_ticks = 0
+        # Round timer value frozen at pause entry (elapsed time can't change while paused).
+        paused_remaining = ROUND_SECONDS
         pause_nav_next_ms = 0
         pause_ignore_confirm_until = 0
+        # (pause_view, pause_menu_index) last presented while paused; None forces a redraw.
+        pause_presented = None
+        # Stage + fighters + HUD captured on the first paused frame; the fight is frozen
+        # while paused, so later paused frames reuse it under the menu.
+        paused_scene: pygame.Surface | None = None
 
         def _enter_pause(now_ms: int):
             nonlocal match_state, pause_menu_index, pause_started_ticks, pause_nav_next_ms, pause_ignore_confirm_until, pause_view
+            nonlocal paused_remaining, paused_scene
             if match_state != 'fighting':
                 return
+            paused_scene = None
             match_state = 'paused'
             pause_menu_index = 0
             pause_view = 'main'
             pause_started_ticks = now_ms
+            paused_remaining = max(0, ROUND_SECONDS - int((now_ms - round_start_ticks) / 1000))
             pause_nav_next_ms = now_ms + 180
             pause_ignore_confirm_until = now_ms + 250
 
         def _resume_from_pause(now_ms: int):
-            nonlocal match_state, round_start_ticks, pause_started_ticks
+            nonlocal match_state, round_start_ticks, pause_started_ticks, paused_scene
             if match_state != 'paused':
                 return
+            paused_scene = None
             # Freeze the round timer while paused by shifting the start tick forward
             if pause_started_ticks:
                 round_start_ticks += (now_ms - pause_started_ticks)
@@ -6314,7 +6569,9 @@ def main() -> None:
 
         def start_round(round_no: int):
             nonlocal round_start_ticks, match_state, current_round, round_winner, round_loser, round_result_reason
+            nonlocal match_over_blits
             current_round = round_no
+            match_over_blits = None
             p1.health = 100
             p2.health = 100
             p1._tens_lost = 0
@@ -6330,11 +6587,26 @@ def main() -> None:
 
         def end_round(winner: Fighter | None, loser: Fighter | None, reason: str):
             nonlocal match_state, round_over_started, round_winner, round_loser, round_result_reason, p1_round_wins, p2_round_wins
+            nonlocal round_over_blits
             round_over_started = pygame.time.get_ticks()
             round_winner = winner
             round_loser = loser
             round_result_reason = reason
 
+            if reason == 'draw':
+                title = 'draw'
+                sub = 'replaying round'
+            else:
+                winner_name = getattr(winner, 'name', 'nate') if winner is not None else 'nate'
+                title = f'{winner_name} wins'
+                sub = 'time over' if reason == 'time' else ''
+            title_s, title_s_hw = render_cached(font_big, title, TEXT_RED)
+            sub_s, sub_s_hw = render_cached(font_small, sub, TEXT_RED)
+            round_over_blits = [
+                (title_s, (WIDTH//2 - title_s_hw, 120)),
+                (sub_s, (WIDTH//2 - sub_s_hw, 190)),
+            ]
+
             if winner is not None and loser is not None:
                 winner.set_end_state('win')
                 loser.set_end_state('lose')
@@ -6359,17 +6631,50 @@ def main() -> None:
                 return True
             return False
 
+        # Events, updates, drawing and flip all stay on this (main) thread on purpose:
+        # SDL's video/event calls aren't thread-safe and macOS only allows them from the
+        # main thread. Per-frame draw cost is kept down with cached surfaces instead.
         running = True
+        frame_ticks = pygame.time.get_ticks()
+        # Only the event types handled below are copied out of SDL; the rest is cleared per
+        # frame (held keys and stick positions come from get_pressed()/get_axis(), not events).
+        fight_event_types = [
+            pygame.QUIT, pygame.KEYDOWN, pygame.JOYBUTTONDOWN,
+            pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION,
+            pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+            pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+        ]
         while running:
+            # Intro / round-over / match-over only react to a few confirm/skip inputs, so
+            # sleep on the event queue for what is left of the frame instead of in tick().
+            if match_state in ('intro', 'round_over', 'match_over'):
+                wait_ms = max(1, 1000 // FPS - (pygame.time.get_ticks() - frame_ticks))
+                events = [pygame.event.wait(wait_ms)]
+                events.extend(pygame.event.get(fight_event_types, pump=False))
+                pygame.event.clear(pump=False)
+            else:
+                events = None
             clock.tick(FPS)
-            draw_stage(screen, stage_bg)
-
-            for event in pygame.event.get():
-                if event.type == SOUND_MGR.MUSIC_END_EVENT:
-                    SOUND_MGR.handle_music_end_event()
-                    continue
+            # One timestamp per frame, shared by input handling, pause nav, the round timer,
+            # the NPC and the round-over countdown.
+            frame_ticks = pygame.time.get_ticks()
+            SOUND_MGR.poll_music()
+
+            if events is None:
+                # One pump per frame; the filtered get and clear reuse it.
+                pygame.event.pump()
+                events = pygame.event.get(fight_event_types, pump=False)
+                pygame.event.clear(pump=False)
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    pause_presented = None
+                    continue
+                if event.type in _JOY_DEVICE_EVENTS:
+                    # Keep the shared pad list fresh for the next menu / match setup.
+                    mark_joysticks_stale()
+                    continue
 
                 # Hitbox editor consumes input while enabled (but does not stop rendering).
                 if HITBOX_EDITOR_MODE and match_state == 'fighting':
@@ -6385,7 +6690,7 @@ def main() -> None:
                 # KEYBOARD INPUT
                 # -----------------
                 if event.type == pygame.KEYDOWN:
-                    now_ms = pygame.time.get_ticks()
+                    now_ms = frame_ticks
 
                     # Hitbox editor toggle (F2)
                     if event.key == pygame.K_F2 and match_state == 'fighting':
@@ -6406,7 +6711,7 @@ def main() -> None:
                                       p2.medium_idle,p2.medium_move_fwd,p2.medium_move_back,p2.medium_block1,p2.medium_block2,p2.attack_r_anim,p2.attack_e_anim,p2.attack_t_anim,p2.attack_y_anim,p2.hit_anim,
                                       p2.low_idle,p2.low_move,p2.low_block,p2.low_attack_r_anim,p2.low_hit_anim,
                                       p2.high_move,p2.high_attack,p2.high_hit,p2.end_win_anim,p2.end_lose_anim]:
-                                a.last_tick = pygame.time.get_ticks()
+                                a.last_tick = now_ms
                         except Exception:
                             pass
                         continue
@@ -6465,7 +6770,7 @@ def main() -> None:
 
                 # Controller buttons
                 if event.type == pygame.JOYBUTTONDOWN:
-                    now_ms = pygame.time.get_ticks()
+                    now_ms = frame_ticks
 
                     # Pause toggle during a fight (controller)
                     # IMPORTANT: On some DualSense (PS5) mappings on macOS, L1/R1 can report as 9/10.
@@ -6532,21 +6837,14 @@ def main() -> None:
             p1_keys = p1_controller.get_keys() if p1_controller is not None else kb_keys
             p2_keys = p2_controller.get_keys() if p2_controller is not None else kb_keys
 
-            # A keys wrapper that reports no input (used to freeze fighters between rounds)
-            class _NoKeys:
-                def __getitem__(self, _key):
-                    return False
-
-            no_keys = _NoKeys()
-
             # -----------------
             # PAUSE MENU NAV (polling)
             # -----------------
             if match_state == 'paused':
-                now_ms = pygame.time.get_ticks()
+                now_ms = frame_ticks
                 if pause_view == 'main' and now_ms >= pause_nav_next_ms:
-                    move_up = kb_keys[pygame.K_UP] or kb_keys[pygame.K_w] or p1_keys[p1.controls['jump']]
-                    move_down = kb_keys[pygame.K_DOWN] or kb_keys[pygame.K_s] or p1_keys[p1.controls['crouch']]
+                    move_up = p1_keys[p1.k_jump] or kb_keys[pygame.K_UP] or kb_keys[pygame.K_w]
+                    move_down = p1_keys[p1.k_crouch] or kb_keys[pygame.K_DOWN] or kb_keys[pygame.K_s]
                     if move_up:
                         pause_menu_index = (pause_menu_index - 1) % len(pause_menu_items)
                         pause_nav_next_ms = now_ms + 180
@@ -6554,6 +6852,11 @@ def main() -> None:
                         pause_menu_index = (pause_menu_index + 1) % len(pause_menu_items)
                         pause_nav_next_ms = now_ms + 180
 
+            # While paused the scene comes from paused_scene, so the stage is only drawn
+            # when that is (re)built. Nothing draws before this point.
+            if match_state != 'paused' or paused_scene is None:
+                draw_stage(screen, stage_bg)
+
             # Auto-facing
             p1.update_facing(p2)
             p2.update_facing(p1)
@@ -6568,37 +6871,8 @@ def main() -> None:
                 intro2.draw(screen)
 
                 # HUD should be visible during the intro (score, timer, round, health, roman tally)
-                remaining = ROUND_SECONDS                # Score (yellow, numbers only) centered above each health bar
-                BAR_W = 280
-                MARGIN = 50
-                score_yellow = (255, 255, 0)
-
-                # Left score (centered over left health bar)
-                p1_score_surf = font_small.render(str(p1.score).zfill(4), True, score_yellow)
-                p1_score_x = MARGIN + (BAR_W // 2) - (p1_score_surf.get_width() // 2)
-                screen.blit(p1_score_surf, (p1_score_x, HUD_SCORE_Y))
-
-                # Right score (centered over right health bar)
-                p2_score_surf = font_small.render(str(p2.score).zfill(4), True, score_yellow)
-                p2_health_x = WIDTH - MARGIN - BAR_W
-                p2_score_x = p2_health_x + (BAR_W // 2) - (p2_score_surf.get_width() // 2)
-                screen.blit(p2_score_surf, (p2_score_x, HUD_SCORE_Y))
-                draw_health_bar(50, HUD_HEALTH_Y, p1.health, BLUE)
-                draw_health_bar(WIDTH - 250, HUD_HEALTH_Y, p2.health, RED)
-
-                # Timer
-                timer_txt = font_mid.render(str(remaining).zfill(2), True, WHITE)
-                screen.blit(timer_txt, (WIDTH // 2 - timer_txt.get_width() // 2, HUD_HEALTH_Y - 10))
-
-                # Round label
-                round_txt = font_small.render(f'ROUND {current_round}', True, WHITE)
-                screen.blit(round_txt, (WIDTH // 2 - round_txt.get_width() // 2, HUD_ROUND_Y))
-
-                # Roman round win tallies
-                p1_roman = font_small.render(wins_to_roman(p1_round_wins), True, WHITE)
-                p2_roman = font_small.render(wins_to_roman(p2_round_wins), True, WHITE)
-                screen.blit(p1_roman, (50 + 100 - p1_roman.get_width() // 2, HUD_ROMAN_Y))
-                screen.blit(p2_roman, (WIDTH - 250 + 100 - p2_roman.get_width() // 2, HUD_ROMAN_Y))
+                draw_hud(font_small, font_mid, p1, p2, ROUND_SECONDS, current_round,
+                         p1_round_wins, p2_round_wins, text_color=WHITE, timer_y=HUD_HEALTH_Y - 10)
 
                 pygame.display.flip()
 
@@ -6612,21 +6886,20 @@ def main() -> None:
                 # =====================
                 # TIMER
                 # =====================
-                now_ms = pygame.time.get_ticks()
-                # Freeze the round timer while paused by pegging elapsed time at pause start.
-                if match_state == 'paused' and pause_started_ticks:
-                    elapsed_ms = pause_started_ticks - round_start_ticks
+                # Paused: reuse the value frozen in _enter_pause (resume shifts round_start_ticks).
+                if match_state == 'paused':
+                    remaining = paused_remaining
                 else:
-                    elapsed_ms = now_ms - round_start_ticks
-                remaining = max(0, ROUND_SECONDS - int(elapsed_ms / 1000))
+                    remaining = max(0, ROUND_SECONDS - int((frame_ticks - round_start_ticks) / 1000))
 
                 # =====================
                 # UPDATE FIGHTERS
                 # =====================
+                # Nothing updates while paused; the frozen frame is kept in paused_scene.
                 if match_state == 'fighting' and not HITBOX_EDITOR_MODE:
                     p1.update(p1_keys, p2)
                     if game_mode == 'single' and npc_controller is not None:
-                        ai_keys = npc_controller.get_keys(p2, p1, pygame.time.get_ticks(), current_round, p1_round_wins, p2_round_wins, match_state)
+                        ai_keys = npc_controller.get_keys(p2, p1, frame_ticks, current_round, p1_round_wins, p2_round_wins, match_state)
                         p2.update(ai_keys, p1)
                     else:
                         p2.update(p2_keys, p1)
@@ -6634,102 +6907,53 @@ def main() -> None:
                     # Resolve pushbox overlap (spacing)
                     hb_resolve_pushboxes(p1, p2)
 
-                    # KO ends round
-                    if p1.health <= 0 or p2.health <= 0:
-                        if p1.health <= 0 and p2.health <= 0:
-                            # Double KO: pick winner by remaining health (equal -> draw)
-                            end_round(None, None, 'draw')
-                        elif p2.health <= 0:
-                            end_round(p1, p2, 'ko')
+                    # KO or time over ends the round (outcome tables above)
+                    p1_ko = p1.health <= 0
+                    p2_ko = p2.health <= 0
+                    if p1_ko or p2_ko or remaining <= 0:
+                        if p1_ko or p2_ko:
+                            w, l, reason = KO_OUTCOMES[(p1_ko, p2_ko)]
                         else:
-                            end_round(p2, p1, 'ko')
-
-                    # Time over ends round
-                    elif remaining <= 0:
-                        if p1.health > p2.health:
-                            end_round(p1, p2, 'time')
-                        elif p2.health > p1.health:
-                            end_round(p2, p1, 'time')
-                        else:
-                            # Tie on time: treat as draw (replay same round)
-                            end_round(None, None, 'draw')
+                            w, l, reason = TIME_OVER_OUTCOMES[(p1.health > p2.health) - (p2.health > p1.health) + 1]
+                        fighters = (p1, p2, None)
+                        end_round(fighters[w], fighters[l], reason)
 
-                elif match_state == 'paused':
-                    # Freeze fighters while paused (no input).
-                    p1.update(no_keys, p2)
-                    p2.update(no_keys, p1)
                 elif match_state in ('round_over', 'match_over'):
                     # During round-over or match-over, fighters only advance end anims
-                    p1.update(no_keys, p2)
-                    p2.update(no_keys, p1)
+                    p1.update(NO_KEYS, p2)
+                    p2.update(NO_KEYS, p1)
 
                 # =====================
                 # DRAW FIGHTERS + HUD
                 # =====================
-                p1.draw(screen)
-                p2.draw(screen)
-
-                if HITBOX_EDITOR_MODE and match_state == 'fighting':
-                    editor.draw_overlay(screen, p1, p2, font_small)                # Score (yellow, numbers only) centered above each health bar
-                BAR_W = 280
-                MARGIN = 50
-                score_yellow = (255, 255, 0)
-
-                # Left score (centered over left health bar)
-                p1_score_surf = font_small.render(str(p1.score).zfill(4), True, score_yellow)
-                p1_score_x = MARGIN + (BAR_W // 2) - (p1_score_surf.get_width() // 2)
-                screen.blit(p1_score_surf, (p1_score_x, HUD_SCORE_Y))
-
-                # Right score (centered over right health bar)
-                p2_score_surf = font_small.render(str(p2.score).zfill(4), True, score_yellow)
-                p2_health_x = WIDTH - MARGIN - BAR_W
-                p2_score_x = p2_health_x + (BAR_W // 2) - (p2_score_surf.get_width() // 2)
-                screen.blit(p2_score_surf, (p2_score_x, HUD_SCORE_Y))
-                draw_health_bar(50, HUD_HEALTH_Y, p1.health, BLUE)
-                draw_health_bar(WIDTH - 250, HUD_HEALTH_Y, p2.health, RED)
-
-                # Timer (top-center)
-                timer_surf = font_mid.render(str(remaining).rjust(2, '0'), True, TEXT_RED)
-                screen.blit(timer_surf, (WIDTH // 2 - timer_surf.get_width() // 2, HUD_TIMER_Y))
-
-                # Round label (centered under the timer)
-                round_text = f'ROUND {current_round}'
-                round_surf = font_small.render(round_text, True, TEXT_RED)
-                screen.blit(round_surf, (WIDTH // 2 - round_surf.get_width() // 2, HUD_ROUND_Y))
-
-                # MK-style round win indicators (roman numerals) under each health bar
-                # Bars are 200px wide starting at x=50 and x=WIDTH-250.
-                left_roman = wins_to_roman(p1_round_wins)
-                right_roman = wins_to_roman(p2_round_wins)
-
-                if left_roman:
-                    l_surf = font_small.render(left_roman, True, TEXT_RED)
-                    screen.blit(l_surf, (50 + 100 - l_surf.get_width() // 2, HUD_ROMAN_Y))
-                if right_roman:
-                    r_surf = font_small.render(right_roman, True, TEXT_RED)
-                    screen.blit(r_surf, (WIDTH - 250 + 100 - r_surf.get_width() // 2, HUD_ROMAN_Y))
+                pause_redraw = match_state == 'paused' and (pause_view, pause_menu_index) != pause_presented
+                if match_state != 'paused' or paused_scene is None:
+                    p1.draw(screen)
+                    p2.draw(screen)
+
+                    if HITBOX_EDITOR_MODE and match_state == 'fighting':
+                        editor.draw_overlay(screen, p1, p2, font_small)
+                    draw_hud(font_small, font_mid, p1, p2, remaining, current_round,
+                             p1_round_wins, p2_round_wins)
+                    if match_state == 'paused':
+                        paused_scene = screen.copy()
+                elif pause_redraw:
+                    screen.blit(paused_scene, (0, 0))
 
                 # =====================
                 # PAUSE OVERLAY
                 # =====================
-                if match_state == 'paused':
-                    screen.blit(pause_overlay, (0, 0))
+                if pause_redraw:
                     if pause_view == 'options':
-                        title_surf = font_mid.render('OPTIONS', True, WHITE)
-                        screen.blit(title_surf, (WIDTH//2 - title_surf.get_width()//2, 140))
-                        msg = font_small.render('Coming soon...', True, WHITE)
-                        screen.blit(msg, (WIDTH//2 - msg.get_width()//2, 230))
+                        screen.blit(pause_options_bg, (0, 0))
                     # hint removed per request
                     # hint blit removed per request
                     else:
-                        title_surf = font_mid.render('PAUSED', True, WHITE)
-                        screen.blit(title_surf, (WIDTH//2 - title_surf.get_width()//2, 140))
-
-                        base_y = 220
-                        for i, item in enumerate(pause_menu_items):
-                            color = (255, 255, 0) if i == pause_menu_index else WHITE
-                            s = font_small.render(item, True, color)
-                            screen.blit(s, (WIDTH//2 - s.get_width()//2, base_y + i * 40))
+                        screen.blit(pause_main_bg, (0, 0))
+                        screen.blits(
+                            [pair[i == pause_menu_index] for i, pair in enumerate(pause_item_blits)],
+                            doreturn=0,
+                        )
 
                     # hint removed per request
                     # hint blit removed per request
@@ -6738,25 +6962,14 @@ def main() -> None:
                 # ROUND OVER TRANSITION
                 # =====================
                 if match_state == 'round_over':
-                    # Overlay round result
-                    if round_result_reason == 'draw':
-                        title = 'draw'
-                        sub = 'replaying round'
-                    else:
-                        winner_name = getattr(round_winner, 'name', 'nate') if round_winner is not None else 'nate'
-                        title = f'{winner_name} wins'
-                        sub = 'time over' if round_result_reason == 'time' else ''
-
-                    title_s = font_big.render(title, True, TEXT_RED)
-                    sub_s = font_small.render(sub, True, TEXT_RED)
-                    screen.blit(title_s, (WIDTH//2 - title_s.get_width()//2, 120))
-                    screen.blit(sub_s, (WIDTH//2 - sub_s.get_width()//2, 190))
+                    # Overlay round result (rendered in end_round)
+                    screen.blits(round_over_blits, doreturn=0)
 
                     # hint removed per request
                     # hint blit removed per request
 
                     # After pause, start next round or end match
-                    now = pygame.time.get_ticks()
+                    now = frame_ticks
                     if round_over_started == 0:
                         # Enter was pressed to skip
                         round_over_started = now - ROUND_OVER_PAUSE_MS - 1
@@ -6784,32 +6997,41 @@ def main() -> None:
                 # MATCH OVER
                 # =====================
                 if match_state == 'match_over':
-                    # Determine final winner by round wins
-                    if p1_round_wins > p2_round_wins:
-                        final_winner, final_loser = p1, p2
-                    elif p2_round_wins > p1_round_wins:
-                        final_winner, final_loser = p2, p1
-                    else:
-                        final_winner, final_loser = None, None
-
-                    if final_winner is not None and final_loser is not None:
-                        winner_name = getattr(final_winner, 'name', 'nate')
-                        loser_name = getattr(final_loser, 'name', 'nate')
-                        win_text = f'{winner_name} wins'
-                        lose_text = f'{loser_name} loses'
-
-                        win_surf = font_big.render(win_text, True, TEXT_RED)
-                        lose_surf = font_mid.render(lose_text, True, TEXT_RED)
-                        screen.blit(win_surf, (WIDTH//2 - win_surf.get_width()//2, 120))
-                        screen.blit(lose_surf, (WIDTH//2 - lose_surf.get_width()//2, 190))
-                    else:
-                        draw_surf = font_big.render('draw', True, TEXT_RED)
-                        screen.blit(draw_surf, (WIDTH//2 - draw_surf.get_width()//2, 140))
+                    # Round wins are final once the match is over, so build the text once.
+                    if match_over_blits is None:
+                        if p1_round_wins > p2_round_wins:
+                            final_winner, final_loser = p1, p2
+                        elif p2_round_wins > p1_round_wins:
+                            final_winner, final_loser = p2, p1
+                        else:
+                            final_winner, final_loser = None, None
+
+                        if final_winner is not None and final_loser is not None:
+                            winner_name = getattr(final_winner, 'name', 'nate')
+                            loser_name = getattr(final_loser, 'name', 'nate')
+                            win_surf, win_surf_hw = render_cached(font_big, f'{winner_name} wins', TEXT_RED)
+                            lose_surf, lose_surf_hw = render_cached(font_mid, f'{loser_name} loses', TEXT_RED)
+                            match_over_blits = [
+                                (win_surf, (WIDTH//2 - win_surf_hw, 120)),
+                                (lose_surf, (WIDTH//2 - lose_surf_hw, 190)),
+                            ]
+                        else:
+                            draw_surf, draw_surf_hw = render_cached(font_big, 'draw', TEXT_RED)
+                            match_over_blits = [(draw_surf, (WIDTH//2 - draw_surf_hw, 140))]
+                    screen.blits(match_over_blits, doreturn=0)
 
                     # hint removed per request
                     # hint blit removed per request
 
-            pygame.display.flip()
+            # While paused the fight is frozen (paused_scene), so only redraw and present
+            # when the pause menu itself changed. Other states animate and always flip.
+            if match_state == 'paused':
+                if (pause_view, pause_menu_index) != pause_presented:
+                    pygame.display.flip()
+                    pause_presented = (pause_view, pause_menu_index)
+            else:
+                pause_presented = None
+                pygame.display.flip()
 
 
         if goto_title: